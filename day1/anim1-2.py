@@ -5,23 +5,19 @@ Run with: manim -pql visualize_dial.py DialAnimation
 from manim import *
 import numpy as np
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from cadran import DEPART, TAILLE_CADRAN, lire_mouvements
 
 DATA_FILE = os.environ.get("DATA_FILE", "data1-test.txt")
+DEGREES_PER_CLICK = 360 / TAILLE_CADRAN
 
 
 class DialAnimation(Scene):
     def construct(self):
-        # Load data
-        with open(DATA_FILE) as f:
-            lignes = f.read().strip().splitlines()
-
-        # Parse movements
-        mouvements = []
-        for ligne in lignes:
-            if ligne[0] == 'R':
-                mouvements.append((ligne, int(ligne[1:])))
-            else:
-                mouvements.append((ligne, -int(ligne[1:])))
+        # Load data (streaming: movements are read lazily during the animation)
+        mouvements = lire_mouvements(DATA_FILE)
 
         # Title
         title = Text("AOC Day 1 - Cadran du Coffre-fort", font_size=32)
@@ -33,11 +29,11 @@ class DialAnimation(Scene):
         dial_circle = Circle(radius=DIAL_RADIUS, color=WHITE, stroke_width=3)
         dial_circle.shift(LEFT * 2)
 
-        # Create number labels around dial (0-99)
+        # Create number labels around dial (0 to TAILLE_CADRAN - 1)
         # Only show every 10th number to avoid clutter
         number_labels = VGroup()
-        for i in range(0, 100, 10):
-            angle = (90 - i * 3.6) * DEGREES  # 0 at top, going clockwise
+        for i in range(0, TAILLE_CADRAN, 10):
+            angle = (90 - i * DEGREES_PER_CLICK) * DEGREES  # 0 at top, going clockwise
             color = RED if i == 0 else WHITE
             label = Text(str(i), font_size=18, color=color)
             label.move_to(dial_circle.get_center() + (DIAL_RADIUS + 0.3) * np.array([
@@ -58,11 +54,11 @@ class DialAnimation(Scene):
 
         # Create pointer (arrow)
         def get_pointer_angle(position):
-            """Convert dial position (0-99) to angle in radians"""
-            return (90 - position * 3.6) * DEGREES
+            """Convert dial position (0 to TAILLE_CADRAN - 1) to angle in radians"""
+            return (90 - position * DEGREES_PER_CLICK) * DEGREES
 
         pointer_length = DIAL_RADIUS - 0.3
-        initial_pos = 50
+        initial_pos = DEPART
         initial_angle = get_pointer_angle(initial_pos)
 
         pointer = Arrow(
@@ -90,9 +86,9 @@ class DialAnimation(Scene):
 
         # Helper to create position label on dial
         def create_dial_pos_label(position):
-            display_pos = position % 100
+            display_pos = position % TAILLE_CADRAN
             if display_pos < 0:
-                display_pos += 100
+                display_pos += TAILLE_CADRAN
             angle = get_pointer_angle(display_pos)
             label = Text(str(display_pos), font_size=16, color=YELLOW)
             label.move_to(dial_circle.get_center() + (DIAL_RADIUS + 0.35) * np.array([
@@ -114,19 +110,20 @@ class DialAnimation(Scene):
         self.wait(0.5)
 
         # Algorithm state
-        pos = 50
+        pos = DEPART
         total_zeros = 0
         dial_pos_label = None  # Dynamic label on dial for non-multiples of 10
 
         # Process each movement
-        for instruction, mouvement in mouvements:
+        for mouvement in mouvements:
+            instruction = f"{'R' if mouvement > 0 else 'L'}{abs(mouvement)}"
             nouvelle_pos = pos + mouvement
 
             # Calculate zeros crossed
             if mouvement > 0:
-                zeros_crossed = (nouvelle_pos // 100) - (pos // 100)
+                zeros_crossed = (nouvelle_pos // TAILLE_CADRAN) - (pos // TAILLE_CADRAN)
             elif mouvement < 0:
-                zeros_crossed = ((pos - 1) // 100) - ((nouvelle_pos - 1) // 100)
+                zeros_crossed = ((pos - 1) // TAILLE_CADRAN) - ((nouvelle_pos - 1) // TAILLE_CADRAN)
             else:
                 zeros_crossed = 0
 
@@ -147,8 +144,8 @@ class DialAnimation(Scene):
                 self.play(Transform(instr_label, new_instr), run_time=0.3)
 
             # Calculate rotation angle
-            # Each position is 3.6 degrees (360/100)
-            rotation_angle = -mouvement * 3.6 * DEGREES  # Negative because clockwise is positive movement
+            # Each position is DEGREES_PER_CLICK degrees (360 / TAILLE_CADRAN)
+            rotation_angle = -mouvement * DEGREES_PER_CLICK * DEGREES  # Negative because clockwise is positive movement
 
             # Animate pointer rotation
             self.play(
@@ -179,11 +176,11 @@ class DialAnimation(Scene):
                     run_time=0.4
                 )
 
-            # Update position (mod 100 for display)
+            # Update position (mod TAILLE_CADRAN for display)
             pos = nouvelle_pos
-            display_pos = pos % 100
+            display_pos = pos % TAILLE_CADRAN
             if display_pos < 0:
-                display_pos += 100
+                display_pos += TAILLE_CADRAN
 
             # Update labels
             new_pos_label = Text(f"Position: {display_pos}", font_size=24, color=YELLOW)
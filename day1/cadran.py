@@ -0,0 +1,370 @@
+# AOC - Day1 - Moteur vectorise (NumPy)
+import os
+import struct
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+DEPART = 50
+TAILLE_CADRAN = 100
+TAILLE_BLOC = 1 << 20  # 1 Mo lu a la fois en mode streaming
+
+
+# Format binaire : entete (magie, version, nombre de mouvements) puis int32 little-endian
+MAGIE = b"CAD1"
+VERSION = 1
+ENTETE = struct.Struct("<4sIQ")
+TYPE_BINAIRE = np.dtype("<i4")
+
+MORCEAUX_PAR_WORKER = 4  # plus de morceaux que de workers pour equilibrer la charge
+TAILLE_TABLE_MAX = 1 << 24  # au-dela, evaluer_configurations ne construit plus de table par residu
+
+# Effet d'une suite de mouvements : deplacement net + passages par 0 selon le residu de depart
+Resume = namedtuple("Resume", ["deplacement", "passages"])
+
+Analyse = namedtuple(
+    "Analyse", ["partie1", "partie2", "histogramme", "plus_longue_serie", "plus_grand_mouvement"]
+)
+
+
+def lire_blocs(nom_fichier, taille_bloc=TAILLE_BLOC, debut=0, fin=None):
+    """Lit le fichier par blocs d'octets, chaque bloc se terminant sur une fin de ligne.
+
+    La ligne coupee en fin de bloc est gardee et recollee au bloc suivant,
+    donc la memoire reste bornee par taille_bloc quelle que soit la taille du fichier.
+    debut/fin limitent la lecture a une plage d'octets (fin exclue).
+    """
+    reste = b""
+    with open(nom_fichier, "rb") as f:
+        f.seek(debut)
+        restant = float("inf") if fin is None else fin - debut
+        while restant > 0 and (bloc := f.read(min(taille_bloc, restant))):
+            restant -= len(bloc)
+            bloc = reste + bloc
+            coupure = bloc.rfind(b"\n") + 1
+            reste = bloc[coupure:]
+            if coupure:
+                yield bloc[:coupure]
+    if reste.strip():
+        yield reste
+
+
+def est_binaire(nom_fichier):
+    """Detecte le format binaire a son entete (sinon : texte R21/L39)"""
+    with open(nom_fichier, "rb") as f:
+        return f.read(len(MAGIE)) == MAGIE
+
+
+def charger_binaire(nom_fichier):
+    """Memory-map des mouvements d'un fichier binaire, sans aucun travail par element"""
+    with open(nom_fichier, "rb") as f:
+        magie, version, nb_mouvements = ENTETE.unpack(f.read(ENTETE.size))
+    if magie != MAGIE or version != VERSION:
+        raise ValueError(f"{nom_fichier} : format binaire inconnu ({magie!r}, version {version})")
+    if nb_mouvements == 0:
+        return np.zeros(0, dtype=TYPE_BINAIRE)
+    return np.memmap(nom_fichier, dtype=TYPE_BINAIRE, mode="r", offset=ENTETE.size, shape=(nb_mouvements,))
+
+
+def convertir_binaire(nom_source, nom_cible):
+    """Convertit un fichier texte en format binaire, en streaming. Renvoie le nombre de mouvements."""
+    nb_mouvements = 0
+    with open(nom_cible, "wb") as f:
+        f.write(ENTETE.pack(MAGIE, VERSION, 0))
+        for mouvements in lire_tableaux(nom_source):
+            if len(mouvements) and np.abs(mouvements).max() > np.iinfo(TYPE_BINAIRE).max:
+                raise ValueError(f"{nom_source} : mouvement hors de la plage int32")
+            f.write(mouvements.astype(TYPE_BINAIRE).tobytes())
+            nb_mouvements += len(mouvements)
+        f.seek(0)
+        f.write(ENTETE.pack(MAGIE, VERSION, nb_mouvements))
+    return nb_mouvements
+
+
+def lire_tableaux(nom_fichier, taille_bloc=TAILLE_BLOC, debut=0, fin=None):
+    """Generateur de tableaux int64 de mouvements, bloc par bloc, texte ou binaire.
+
+    debut/fin sont des offsets en octets ; en binaire ils sont ramenes aux
+    mouvements entiers qui commencent dans la plage.
+    """
+    if not est_binaire(nom_fichier):
+        for bloc in lire_blocs(nom_fichier, taille_bloc, debut, fin):
+            yield parser_mouvements(bloc)
+        return
+
+    mouvements = charger_binaire(nom_fichier)
+    taille = TYPE_BINAIRE.itemsize
+    premier = max(debut - ENTETE.size + taille - 1, 0) // taille
+    dernier = len(mouvements) if fin is None else (fin - ENTETE.size + taille - 1) // taille
+    pas = max(taille_bloc // taille, 1)
+    for i in range(premier, dernier, pas):
+        yield np.asarray(mouvements[i:min(i + pas, dernier)], dtype=np.int64)
+
+
+def lire_mouvements(nom_fichier, taille_bloc=TAILLE_BLOC):
+    """Generateur des mouvements signes (R21 -> 21, L39 -> -39) en streaming, texte ou binaire"""
+    for mouvements in lire_tableaux(nom_fichier, taille_bloc):
+        yield from mouvements.tolist()
+
+
+NB_CHIFFRES_MAX = 18  # 10^18 - 1 tient en int64, pas tous les nombres de 19 chiffres
+PUISSANCES_10 = 10 ** np.arange(NB_CHIFFRES_MAX, dtype=np.int64)
+
+
+def parser_mouvements(donnees):
+    """Transforme les octets 'R21\nL39...' en tableau int64 de mouvements signes.
+
+    Tout est fait sur le buffer brut avec NumPy, sans objet Python par ligne :
+    chaque chiffre est rattache au dernier L/R qui le precede, multiplie par
+    la puissance de 10 de son rang dans le nombre, puis les chiffres d'un meme
+    nombre sont additionnes. Les espaces et fins de ligne (\r, \n, espaces en
+    fin de fichier) sont simplement ignores.
+    """
+    if isinstance(donnees, str):
+        donnees = donnees.encode()
+    octets = np.frombuffer(donnees, dtype=np.uint8)
+
+    est_marqueur = (octets == ord("L")) | (octets == ord("R"))
+    marqueurs = np.flatnonzero(est_marqueur)
+    chiffres = np.flatnonzero((octets >= ord("0")) & (octets <= ord("9")))
+
+    # Numero du mouvement de chaque chiffre = nombre de marqueurs vus avant lui - 1
+    numeros = np.cumsum(est_marqueur)[chiffres] - 1
+    chiffres = chiffres[numeros >= 0]
+    numeros = numeros[numeros >= 0]
+
+    longueurs = np.bincount(numeros, minlength=len(marqueurs))
+    if len(longueurs) and longueurs.max() > NB_CHIFFRES_MAX:
+        raise ValueError(f"mouvement de plus de {NB_CHIFFRES_MAX} chiffres (hors de la plage int64)")
+
+    # Rang du chiffre compte depuis la fin de son nombre (0 = unites)
+    fins = np.cumsum(longueurs)
+    rangs = fins[numeros] - 1 - np.arange(len(chiffres))
+    valeurs = (octets[chiffres] - ord("0")).astype(np.int64) * PUISSANCES_10[rangs]
+
+    # Somme des chiffres de chaque nombre par difference de sommes cumulees
+    cumul = np.concatenate(([0], np.cumsum(valeurs)))
+    nombres = cumul[fins] - np.concatenate(([0], cumul[fins[:-1]]))
+
+    return np.where(octets[marqueurs] == ord("L"), -nombres, nombres)
+
+
+def passages_par_mouvement(mouvements, depart=DEPART):
+    """Passages par 0 de chaque mouvement et positions absolues (len + 1, depart inclus)"""
+    positions = np.empty(len(mouvements) + 1, dtype=np.int64)
+    positions[0] = depart
+    np.cumsum(mouvements, out=positions[1:])
+    positions[1:] += depart
+
+    pos = positions[:-1]
+    nouvelle_pos = positions[1:]
+
+    # Meme formule que la boucle de solve1-2-optimise.py, appliquee a tout le tableau
+    droite = (nouvelle_pos // TAILLE_CADRAN) - (pos // TAILLE_CADRAN)
+    gauche = ((pos - 1) // TAILLE_CADRAN) - ((nouvelle_pos - 1) // TAILLE_CADRAN)
+    passages = np.where(mouvements > 0, droite, np.where(mouvements < 0, gauche, 0))
+
+    return passages, positions
+
+
+def passages_par_zero(mouvements, depart=DEPART):
+    """Compte les passages par 0 pour tous les mouvements d'un coup.
+
+    Renvoie (reponse, position_finale) en position absolue, pour pouvoir
+    enchainer plusieurs appels sur des morceaux successifs.
+    """
+    passages, positions = passages_par_mouvement(mouvements, depart)
+    return int(passages.sum()), int(positions[-1])
+
+
+def positions_relatives(mouvements):
+    """Positions apres chaque mouvement en partant de 0 (len + 1, 0 inclus)"""
+    positions = np.zeros(len(mouvements) + 1, dtype=np.int64)
+    np.cumsum(mouvements, out=positions[1:])
+    return positions
+
+
+def _termes_passages(mouvements, positions):
+    """Terme positif (haut) et terme negatif (bas) de la formule selon le sens"""
+    pos = positions[:-1]
+    nouvelle_pos = positions[1:]
+    vers_gauche = mouvements < 0
+    haut = np.where(vers_gauche, pos - 1, nouvelle_pos)
+    bas = np.where(vers_gauche, nouvelle_pos - 1, pos)
+    return haut, bas
+
+
+def passages_par_residu(mouvements, positions, taille=TAILLE_CADRAN):
+    """Passages par 0 pour chacun des taille residus de depart possibles.
+
+    Les passages ne dependent de la position de depart que via son residu r.
+    Pour un terme x // taille de la formule, decaler le depart de r ajoute 1
+    des que r >= taille - x % taille : on compte ces seuils avec bincount, puis
+    un cumsum donne les passages pour tous les r en O(n + taille).
+    """
+    haut, bas = _termes_passages(mouvements, positions)
+    base = int((haut // taille - bas // taille).sum())
+    seuils = np.bincount(taille - haut % taille, minlength=taille + 1)
+    seuils -= np.bincount(taille - bas % taille, minlength=taille + 1)
+    return base + np.cumsum(seuils[:taille])
+
+
+def arrets_par_residu(positions, taille=TAILLE_CADRAN):
+    """Arrets sur 0 (partie 1) pour chacun des taille residus de depart possibles.
+
+    Depuis r, on s'arrete sur 0 apres le mouvement i si r + P_i = 0 mod taille,
+    soit r = -P_i mod taille : un seul bincount suffit.
+    """
+    return np.bincount(-positions[1:] % taille, minlength=taille)
+
+
+def passages_depuis(mouvements, positions, residus, taille=TAILLE_CADRAN):
+    """Passages par 0 pour quelques residus de depart seulement, en O(n) par residu.
+
+    Pas de tableau de taille taille : utile pour un tres grand cadran.
+    """
+    haut, bas = _termes_passages(mouvements, positions)
+    return np.array(
+        [int(((haut + r) // taille - (bas + r) // taille).sum()) for r in residus], dtype=np.int64
+    )
+
+
+def arrets_depuis(positions, residus, taille=TAILLE_CADRAN):
+    """Arrets sur 0 pour quelques residus de depart seulement, en O(n) par residu"""
+    return np.array(
+        [int(np.count_nonzero((positions[1:] + r) % taille == 0)) for r in residus], dtype=np.int64
+    )
+
+
+def resumer(mouvements, taille=TAILLE_CADRAN):
+    """Resume (deplacement net, passages par residu de depart) d'une suite de mouvements"""
+    positions = positions_relatives(mouvements)
+    return Resume(int(positions[-1]), passages_par_residu(mouvements, positions, taille))
+
+
+def fusionner(a, b):
+    """Resume de a suivi de b : b demarre decale du deplacement de a"""
+    decalage = a.deplacement % len(a.passages)
+    return Resume(a.deplacement + b.deplacement, a.passages + np.roll(b.passages, -decalage))
+
+
+def resume_vide(taille=TAILLE_CADRAN):
+    return Resume(0, np.zeros(taille, dtype=np.int64))
+
+
+def evaluer_configurations(mouvements, departs, tailles):
+    """Parties 1 et 2 pour chaque combinaison (depart, taille de cadran).
+
+    Renvoie deux tableaux (len(departs), len(tailles)) : arrets sur 0 et passages par 0.
+    Les mouvements ne sont parcourus qu'une fois par taille distincte (O(n + taille)),
+    tous les departs d'une meme taille sont lus d'un coup dans les tableaux par residu.
+    Quand taille depasse TAILLE_TABLE_MAX ou le cout direct (n par residu demande),
+    les residus demandes sont evalues un par un sans tableau de taille taille.
+    """
+    departs = np.asarray(departs, dtype=np.int64)
+    tailles = np.asarray(tailles, dtype=np.int64)
+    positions = positions_relatives(mouvements)
+
+    arrets = np.empty((len(departs), len(tailles)), dtype=np.int64)
+    passages = np.empty((len(departs), len(tailles)), dtype=np.int64)
+    for taille in np.unique(tailles):
+        taille = int(taille)
+        colonnes = tailles == taille
+        residus, inverses = np.unique(departs % taille, return_inverse=True)
+        if taille > TAILLE_TABLE_MAX or len(residus) * len(mouvements) < taille:
+            arrets_residus = arrets_depuis(positions, residus, taille)
+            passages_residus = passages_depuis(mouvements, positions, residus, taille)
+        else:
+            arrets_residus = arrets_par_residu(positions, taille)[residus]
+            passages_residus = passages_par_residu(mouvements, positions, taille)[residus]
+        arrets[:, colonnes] = arrets_residus[inverses][:, None]
+        passages[:, colonnes] = passages_residus[inverses][:, None]
+
+    return arrets, passages
+
+
+def decouper_fichier(nom_fichier, nb_morceaux):
+    """Decoupe le fichier en plages d'octets (debut, fin) alignees sur les fins de ligne.
+
+    En binaire, les plages sont alignees sur les mouvements apres l'entete.
+    """
+    taille = os.path.getsize(nom_fichier)
+    if est_binaire(nom_fichier):
+        nb_mouvements = len(charger_binaire(nom_fichier))
+        bornes = [
+            ENTETE.size + TYPE_BINAIRE.itemsize * (nb_mouvements * i // nb_morceaux)
+            for i in range(nb_morceaux + 1)
+        ]
+        return [(debut, fin) for debut, fin in zip(bornes, bornes[1:]) if fin > debut]
+
+    bornes = [0]
+    with open(nom_fichier, "rb") as f:
+        for i in range(1, nb_morceaux):
+            f.seek(max(taille * i // nb_morceaux, bornes[-1]))
+            f.readline()  # avance jusqu'au debut de la ligne suivante
+            bornes.append(min(f.tell(), taille))
+    bornes.append(taille)
+    return [(debut, fin) for debut, fin in zip(bornes, bornes[1:]) if fin > debut]
+
+
+def resumer_plage(nom_fichier, debut, fin):
+    """Resume d'une plage d'octets du fichier, lue en streaming (execute dans un worker)"""
+    resume = resume_vide()
+    for mouvements in lire_tableaux(nom_fichier, debut=debut, fin=fin):
+        resume = fusionner(resume, resumer(mouvements))
+    return resume
+
+
+def resoudre_parallele(nom_fichier, workers, depart=DEPART):
+    """Map-reduce : resume de chaque plage dans un ProcessPoolExecutor, fusion dans l'ordre.
+
+    Renvoie (reponse, position_finale) comme passages_par_zero.
+    """
+    plages = decouper_fichier(nom_fichier, workers * MORCEAUX_PAR_WORKER)
+    resume = resume_vide()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        debuts, fins = zip(*plages) if plages else ((), ())
+        for morceau in executor.map(resumer_plage, [nom_fichier] * len(plages), debuts, fins):
+            resume = fusionner(resume, morceau)
+    return int(resume.passages[depart % TAILLE_CADRAN]), depart + resume.deplacement
+
+
+def analyser(nom_fichier, depart=DEPART):
+    """Un seul passage sur le fichier pour les deux parties et quelques statistiques.
+
+    - partie1 : arrets sur 0 (solve1-1.py), partie2 : passages par 0 (solve1-2*.py)
+    - histogramme : nombre d'arrets sur chaque position du cadran
+    - plus_longue_serie : plus grand nombre de mouvements consecutifs sans toucher 0
+    - plus_grand_mouvement : plus grande rotation (en valeur absolue)
+    """
+    pos = depart
+    partie1 = partie2 = 0
+    histogramme = np.zeros(TAILLE_CADRAN, dtype=np.int64)
+    serie = plus_longue_serie = plus_grand_mouvement = 0
+
+    for mouvements in lire_tableaux(nom_fichier):
+        if not len(mouvements):
+            continue
+        passages, positions = passages_par_mouvement(mouvements, pos)
+        residus = positions[1:] % TAILLE_CADRAN
+        pos = int(positions[-1])
+
+        partie1 += int(np.count_nonzero(residus == 0))
+        partie2 += int(passages.sum())
+        histogramme += np.bincount(residus, minlength=TAILLE_CADRAN)
+        plus_grand_mouvement = max(plus_grand_mouvement, int(np.abs(mouvements).max()))
+
+        # La serie en cours continue d'un bloc a l'autre
+        touches = np.flatnonzero((passages > 0) | (residus == 0))
+        if not len(touches):
+            serie += len(mouvements)
+            continue
+        ecarts = np.diff(touches) - 1
+        plus_longue_serie = max(
+            plus_longue_serie, serie + int(touches[0]), int(ecarts.max()) if len(ecarts) else 0
+        )
+        serie = len(mouvements) - int(touches[-1]) - 1
+
+    plus_longue_serie = max(plus_longue_serie, serie)
+    return Analyse(partie1, partie2, histogramme, plus_longue_serie, plus_grand_mouvement)
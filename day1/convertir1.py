@@ -0,0 +1,11 @@
+# AOC - Day1 - Conversion texte (R21/L39) -> binaire int32 little-endian
+import sys
+
+from cadran import convertir_binaire
+
+nom_fichier = sys.argv[1] if len(sys.argv) > 1 else "data1.txt"
+nom_cible = sys.argv[2] if len(sys.argv) > 2 else nom_fichier.rsplit(".", 1)[0] + ".bin"
+
+nb_mouvements = convertir_binaire(nom_fichier, nom_cible)
+
+print(f"{nb_mouvements} mouvements ecrits dans {nom_cible}")
@@ -0,0 +1,356 @@
+# AOC - Day1 - Index des instructions (treap de blocs, sommes prefixes)
+"""
+IndexCadran : index sur la liste des mouvements qui garde a jour le nombre
+de passages par 0 et la position finale quand on corrige, insere ou supprime
+une instruction.
+
+Les mouvements sont ranges par blocs dans un treap implicite (arbre trie par
+position, equilibre par des priorites aleatoires). Chaque noeud stocke le
+Resume (deplacement, passages par residu) de son sous-arbre, calcule avec
+cadran.resumer / cadran.fusionner. Une modification ne recalcule que le bloc
+touche et les O(log n) resumes sur le chemin vers la racine.
+
+    index = IndexCadran.depuis_fichier("data1.txt")
+    reponse, position = index.update(42, -17)
+
+PrefixesCadran : tableaux prefixes (positions, passages cumules) calcules une
+fois et sauves a cote du fichier d'entree, pour repondre aux questions
+"combien de passages entre les instructions i et j" en O(1) et
+"a quelle instruction le compteur atteint K" en O(log n).
+"""
+import os
+import random
+from bisect import bisect_left
+
+import numpy as np
+
+from cadran import (
+    DEPART,
+    TAILLE_CADRAN,
+    fusionner,
+    lire_tableaux,
+    passages_par_mouvement,
+    resume_vide,
+    resumer,
+)
+
+TAILLE_FEUILLE = 512  # un bloc est coupe en deux au-dela de 2 * TAILLE_FEUILLE
+
+
+class _Noeud:
+    __slots__ = ("bloc", "priorite", "gauche", "droite", "taille", "resume_bloc", "resume")
+
+    def __init__(self, bloc):
+        self.bloc = bloc
+        self.priorite = random.random()
+        self.gauche = None
+        self.droite = None
+        self.resume_bloc = resumer(bloc)
+        self.taille = len(bloc)
+        self.resume = self.resume_bloc
+
+
+def _taille(noeud):
+    return noeud.taille if noeud is not None else 0
+
+
+def _maj(noeud):
+    """Recalcule taille et resume du sous-arbre a partir des enfants"""
+    resume = noeud.resume_bloc
+    if noeud.gauche is not None:
+        resume = fusionner(noeud.gauche.resume, resume)
+    if noeud.droite is not None:
+        resume = fusionner(resume, noeud.droite.resume)
+    noeud.resume = resume
+    noeud.taille = _taille(noeud.gauche) + len(noeud.bloc) + _taille(noeud.droite)
+    return noeud
+
+
+def _maj_chemin(chemin):
+    """Recalcule les resumes d'un chemin racine -> noeud, du bas vers le haut"""
+    for noeud in reversed(chemin):
+        _maj(noeud)
+
+
+def _fusionner_arbres(a, b):
+    """Concatene deux treaps (tous les elements de a avant ceux de b).
+
+    Iteratif : on descend le bord droit de a et le bord gauche de b en prenant
+    a chaque pas la plus forte priorite, puis on remonte les resumes.
+    """
+    racine = parent = cote = None
+    chemin = []
+    while a is not None and b is not None:
+        if a.priorite > b.priorite:
+            noeud, a = a, a.droite
+            prochain = "droite"
+        else:
+            noeud, b = b, b.gauche
+            prochain = "gauche"
+        if parent is None:
+            racine = noeud
+        else:
+            setattr(parent, cote, noeud)
+        parent, cote = noeud, prochain
+        chemin.append(noeud)
+
+    reste = a if a is not None else b
+    if parent is None:
+        return reste
+    setattr(parent, cote, reste)
+    _maj_chemin(chemin)
+    return racine
+
+
+def _couper(noeud, k):
+    """Coupe un treap en (a, b) : a garde les k premiers mouvements.
+
+    k doit tomber sur une frontiere de bloc. Les noeuds qui partent a gauche
+    forment le bord droit de a, ceux qui partent a droite le bord gauche de b.
+    """
+    gauches, droits = [], []
+    while noeud is not None:
+        fin_bloc = _taille(noeud.gauche) + len(noeud.bloc)
+        if k >= fin_bloc:
+            gauches.append(noeud)
+            k -= fin_bloc
+            noeud = noeud.droite
+        else:
+            droits.append(noeud)
+            noeud = noeud.gauche
+
+    for liste, cote in ((gauches, "droite"), (droits, "gauche")):
+        for noeud, suivant in zip(liste, liste[1:] + [None]):
+            setattr(noeud, cote, suivant)
+        _maj_chemin(liste)
+    return (gauches[0] if gauches else None), (droits[0] if droits else None)
+
+
+def _modifier_bloc(noeud, bloc):
+    noeud.bloc = bloc
+    noeud.resume_bloc = resumer(bloc)
+
+
+class IndexCadran:
+    def __init__(self, mouvements=(), depart=DEPART):
+        self.depart = depart
+        mouvements = np.asarray(mouvements, dtype=np.int64)
+        noeuds = [
+            _Noeud(mouvements[i:i + TAILLE_FEUILLE].copy())
+            for i in range(0, len(mouvements), TAILLE_FEUILLE)
+        ]
+        self.racine = self._construire(noeuds)
+
+    @classmethod
+    def depuis_fichier(cls, nom_fichier, depart=DEPART):
+        mouvements = list(lire_tableaux(nom_fichier))
+        return cls(np.concatenate(mouvements) if mouvements else (), depart)
+
+    @staticmethod
+    def _construire(noeuds):
+        """Arbre cartesien en O(n) avec une pile, puis resumes de bas en haut"""
+        pile = []
+        for noeud in noeuds:
+            dernier = None
+            while pile and pile[-1].priorite < noeud.priorite:
+                dernier = pile.pop()
+            noeud.gauche = dernier
+            if pile:
+                pile[-1].droite = noeud
+            pile.append(noeud)
+
+        def maj_recursive(noeud):
+            if noeud is not None:
+                maj_recursive(noeud.gauche)
+                maj_recursive(noeud.droite)
+                _maj(noeud)
+
+        racine = pile[0] if pile else None
+        maj_recursive(racine)
+        return racine
+
+    def __len__(self):
+        return _taille(self.racine)
+
+    def __getitem__(self, i):
+        noeud, j = self._trouver(i)
+        return int(noeud.bloc[j])
+
+    def _verifier_index(self, i, borne):
+        if not 0 <= i < borne:
+            raise IndexError(f"index {i} hors de [0, {borne})")
+
+    def _trouver(self, i):
+        self._verifier_index(i, len(self))
+        chemin, j, _ = self._chemin(i)
+        return chemin[-1], j
+
+    def _chemin(self, i, insertion=False):
+        """Chemin racine -> bloc contenant le mouvement i : (chemin, index dans le bloc, debut du bloc).
+
+        En insertion, i peut valoir la fin d'un bloc : on ajoute alors en fin
+        de ce bloc plutot qu'au debut du suivant (i == len ajoute au dernier bloc).
+        """
+        chemin = []
+        noeud = self.racine
+        debut = 0
+        while True:
+            chemin.append(noeud)
+            g = _taille(noeud.gauche)
+            if i < g or (insertion and i == g and noeud.gauche is not None):
+                noeud = noeud.gauche
+            elif i < g + len(noeud.bloc) or (insertion and i == g + len(noeud.bloc)):
+                return chemin, i - g, debut + g
+            else:
+                i -= g + len(noeud.bloc)
+                debut += g + len(noeud.bloc)
+                noeud = noeud.droite
+
+    def profondeur(self):
+        """Hauteur du treap en noeuds (O(log nombre de blocs) en esperance)"""
+        hauteur = 0
+        niveau = [self.racine] if self.racine is not None else []
+        while niveau:
+            hauteur += 1
+            niveau = [enfant for noeud in niveau for enfant in (noeud.gauche, noeud.droite) if enfant is not None]
+        return hauteur
+
+    def _resultat(self):
+        resume = self.racine.resume if self.racine is not None else resume_vide()
+        return int(resume.passages[self.depart % TAILLE_CADRAN]), self.depart + resume.deplacement
+
+    def total(self):
+        """Nombre total de passages par 0 depuis la position de depart"""
+        return self._resultat()[0]
+
+    def position_finale(self):
+        return self._resultat()[1]
+
+    def update(self, i, mouvement):
+        """Remplace le mouvement i, renvoie (reponse, position_finale)"""
+        self._verifier_index(i, len(self))
+        chemin, j, _ = self._chemin(i)
+        bloc = chemin[-1].bloc.copy()
+        bloc[j] = mouvement
+        _modifier_bloc(chemin[-1], bloc)
+        _maj_chemin(chemin)
+        return self._resultat()
+
+    def insert(self, i, mouvement):
+        """Insere un mouvement avant la position i (i == len pour ajouter a la fin)"""
+        self._verifier_index(i, len(self) + 1)
+        if self.racine is None:
+            self.racine = _Noeud(np.array([mouvement], dtype=np.int64))
+            return self._resultat()
+
+        chemin, j, debut = self._chemin(i, insertion=True)
+        noeud = chemin[-1]
+        bloc = np.insert(noeud.bloc, j, mouvement)
+        if len(bloc) <= 2 * TAILLE_FEUILLE:
+            _modifier_bloc(noeud, bloc)
+            _maj_chemin(chemin)
+            return self._resultat()
+
+        # Bloc trop gros : la seconde moitie devient un nouveau noeud, avec sa
+        # propre priorite, insere juste apres par coupe + fusions du treap
+        _modifier_bloc(noeud, bloc[:TAILLE_FEUILLE])
+        _maj_chemin(chemin)
+        avant, apres = _couper(self.racine, debut + TAILLE_FEUILLE)
+        nouveau = _Noeud(bloc[TAILLE_FEUILLE:].copy())
+        self.racine = _fusionner_arbres(_fusionner_arbres(avant, nouveau), apres)
+        return self._resultat()
+
+    def delete(self, i):
+        """Supprime le mouvement i, renvoie (reponse, position_finale)"""
+        self._verifier_index(i, len(self))
+        chemin, j, _ = self._chemin(i)
+        noeud = chemin.pop()
+        if len(noeud.bloc) > 1:
+            _modifier_bloc(noeud, np.delete(noeud.bloc, j))
+            _maj(noeud)
+        else:
+            # Bloc vide : le noeud disparait, ses enfants prennent sa place
+            remplacant = _fusionner_arbres(noeud.gauche, noeud.droite)
+            if not chemin:
+                self.racine = remplacant
+            elif chemin[-1].gauche is noeud:
+                chemin[-1].gauche = remplacant
+            else:
+                chemin[-1].droite = remplacant
+        _maj_chemin(chemin)
+        return self._resultat()
+
+
+class PrefixesCadran:
+    """Instructions numerotees a partir de 1 comme les lignes du fichier.
+
+    positions[i] : position absolue apres l'instruction i (positions[0] = depart)
+    cumul[i]     : passages par 0 pendant les instructions 1..i (cumul[0] = 0)
+    """
+
+    def __init__(self, positions, cumul):
+        self.positions = positions
+        self.cumul = cumul
+
+    @staticmethod
+    def fichiers(nom_fichier):
+        return nom_fichier + ".positions.npy", nom_fichier + ".passages.npy"
+
+    @classmethod
+    def construire(cls, nom_fichier, depart=DEPART):
+        """Calcule les tableaux en un passage streaming et les sauve a cote de l'entree"""
+        positions = [np.array([depart], dtype=np.int64)]
+        passages = [np.zeros(1, dtype=np.int64)]
+        pos = depart
+        for mouvements in lire_tableaux(nom_fichier):
+            passages_bloc, positions_bloc = passages_par_mouvement(mouvements, pos)
+            passages.append(passages_bloc)
+            positions.append(positions_bloc[1:])
+            pos = int(positions_bloc[-1])
+
+        fichier_positions, fichier_passages = cls.fichiers(nom_fichier)
+        np.save(fichier_positions, np.concatenate(positions))
+        np.save(fichier_passages, np.cumsum(np.concatenate(passages)))
+        return cls.charger(nom_fichier, reconstruire=False)
+
+    @classmethod
+    def charger(cls, nom_fichier, depart=DEPART, reconstruire=True):
+        """Charge les tableaux en memory-map, en les (re)construisant s'ils sont perimes"""
+        fichier_positions, fichier_passages = cls.fichiers(nom_fichier)
+        if reconstruire:
+            a_jour = all(
+                os.path.exists(f) and os.path.getmtime(f) >= os.path.getmtime(nom_fichier)
+                for f in (fichier_positions, fichier_passages)
+            )
+            if not a_jour or np.load(fichier_positions, mmap_mode="r")[0] != depart:
+                return cls.construire(nom_fichier, depart)
+        return cls(np.load(fichier_positions, mmap_mode="r"), np.load(fichier_passages, mmap_mode="r"))
+
+    def __len__(self):
+        return len(self.cumul) - 1
+
+    def passages_entre(self, i, j):
+        """Passages par 0 pendant les instructions i a j incluses (1 <= i <= j <= n), en O(1)"""
+        if not 1 <= i <= j <= len(self):
+            raise IndexError(f"plage [{i}, {j}] hors de [1, {len(self)}]")
+        return int(self.cumul[j] - self.cumul[i - 1])
+
+    def position_apres(self, i):
+        """Position du cadran (0-99) apres l'instruction i (0 = depart)"""
+        return int(self.positions[i] % TAILLE_CADRAN)
+
+    def premier_atteint(self, k):
+        """Premiere instruction apres laquelle le compteur vaut au moins k (None si jamais)"""
+        i = bisect_left(self.cumul, k)
+        return i if i <= len(self) else None
+
+    def passages_entre_lot(self, debuts, fins):
+        """Version tableau de passages_entre (bornes non verifiees)"""
+        debuts = np.asarray(debuts, dtype=np.int64)
+        fins = np.asarray(fins, dtype=np.int64)
+        return self.cumul[fins] - self.cumul[debuts - 1]
+
+    def premier_atteint_lot(self, ks):
+        """Version tableau de premier_atteint : -1 quand k n'est jamais atteint"""
+        indices = np.searchsorted(self.cumul, np.asarray(ks, dtype=np.int64), side="left")
+        return np.where(indices <= len(self), indices, -1)
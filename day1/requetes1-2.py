@@ -0,0 +1,21 @@
+# AOC - Day1 Part 2 - Requetes sur les passages par 0 (sommes prefixes)
+import argparse
+
+from index_cadran import PrefixesCadran
+
+parser = argparse.ArgumentParser()
+parser.add_argument("nom_fichier")
+commandes = parser.add_subparsers(dest="commande", required=True)
+entre = commandes.add_parser("entre", help="passages entre les instructions i et j incluses")
+entre.add_argument("i", type=int)
+entre.add_argument("j", type=int)
+atteint = commandes.add_parser("atteint", help="premiere instruction ou le compteur atteint K")
+atteint.add_argument("k", type=int)
+args = parser.parse_args()
+
+prefixes = PrefixesCadran.charger(args.nom_fichier)
+
+if args.commande == "entre":
+    print(prefixes.passages_entre(args.i, args.j))
+else:
+    print(prefixes.premier_atteint(args.k))
@@ -2,25 +2,16 @@
 
 import sys
 
-nom_fichier = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
-
-with open(nom_fichier) as f:
-    data = f.read().strip()
-    lignes = data.splitlines()
+from cadran import DEPART, TAILLE_CADRAN, lire_mouvements
 
-resultat = []
-
-for ligne in lignes:
-    if ligne[0] == "L":
-        resultat.append(-int(ligne[1:]))
-    else:
-        resultat.append(int(ligne[1:]))
+nom_fichier = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
 
-position_absolue = 50
+position_absolue = DEPART
 reponse = 0
 
-for i in resultat:
-    position_absolue = (position_absolue + i) % 100
+# Lecture en streaming : seuls position_absolue et reponse restent en memoire
+for i in lire_mouvements(nom_fichier):
+    position_absolue = (position_absolue + i) % TAILLE_CADRAN
 
     if position_absolue == 0:
         reponse += 1
@@ -0,0 +1,23 @@
+# AOC - Day1 Part 2 - Vectorise (NumPy)
+import argparse
+
+from cadran import DEPART, lire_tableaux, passages_par_zero, resoudre_parallele
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("nom_fichier", nargs="?", default="data1.txt", help="texte ou binaire (convertir1.py)")
+    parser.add_argument("--workers", type=int, default=1, help="nombre de processus (map-reduce)")
+    args = parser.parse_args()
+
+    if args.workers > 1:
+        reponse, _ = resoudre_parallele(args.nom_fichier, args.workers)
+    else:
+        pos = DEPART
+        reponse = 0
+
+        # Un bloc a la fois : la position finale d'un bloc sert de depart au suivant
+        for mouvements in lire_tableaux(args.nom_fichier):
+            passages, pos = passages_par_zero(mouvements, pos)
+            reponse += passages
+
+    print(reponse)
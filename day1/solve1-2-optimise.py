@@ -1,22 +1,20 @@
 # AOC - Day1 Part 2 - Optimise
 import sys
 
-nom_fichier = sys.argv[1] if len(sys.argv) > 1 else "data1.txt"
+from cadran import DEPART, TAILLE_CADRAN, lire_mouvements
 
-with open(nom_fichier) as f:
-    lignes = f.read().strip().splitlines()
+nom_fichier = sys.argv[1] if len(sys.argv) > 1 else "data1.txt"
 
-pos = 50
+pos = DEPART
 reponse = 0
 
-for ligne in lignes:
-    mouvement = int(ligne[1:]) if ligne[0] == 'R' else -int(ligne[1:])
+for mouvement in lire_mouvements(nom_fichier):
     nouvelle_pos = pos + mouvement
 
     if mouvement > 0:
-        reponse += (nouvelle_pos // 100) - (pos // 100)
+        reponse += (nouvelle_pos // TAILLE_CADRAN) - (pos // TAILLE_CADRAN)
     elif mouvement < 0:
-        reponse += ((pos - 1) // 100) - ((nouvelle_pos - 1) // 100)
+        reponse += ((pos - 1) // TAILLE_CADRAN) - ((nouvelle_pos - 1) // TAILLE_CADRAN)
 
     pos = nouvelle_pos
 
@@ -2,34 +2,25 @@
 
 import sys
 
-nom_fichier = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
-
-with open(nom_fichier) as f:
-    data = f.read().strip()
-    lignes = data.splitlines()
+from cadran import DEPART, TAILLE_CADRAN, lire_mouvements
 
-resultat = []
-
-for ligne in lignes:
-    if ligne[0] == "L":
-        resultat.append(-int(ligne[1:]))
-    else:
-        resultat.append(int(ligne[1:]))
+nom_fichier = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
 
-position_absolue = 50
+position_absolue = DEPART
 reponse = 0
 
-for mouvement in resultat:
+# Lecture en streaming : seuls position_absolue et reponse restent en memoire
+for mouvement in lire_mouvements(nom_fichier):
     ancienne_position = position_absolue
     position_absolue += mouvement
 
     count = 0
 
     if mouvement > 0:
-        count = (position_absolue // 100) - (ancienne_position // 100)
+        count = (position_absolue // TAILLE_CADRAN) - (ancienne_position // TAILLE_CADRAN)
 
     elif mouvement < 0:
-        count = ((ancienne_position - 1) // 100) - ((position_absolue - 1) // 100)
+        count = ((ancienne_position - 1) // TAILLE_CADRAN) - ((position_absolue - 1) // TAILLE_CADRAN)
 
     reponse += count
 
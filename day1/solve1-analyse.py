@@ -0,0 +1,16 @@
+# AOC - Day1 - Parties 1 et 2 + statistiques en un seul passage
+import sys
+
+from cadran import analyser
+
+nom_fichier = sys.argv[1] if len(sys.argv) > 1 else "data1.txt"
+
+analyse = analyser(nom_fichier)
+
+print(f"Partie 1 (arrets sur 0) : {analyse.partie1}")
+print(f"Partie 2 (passages par 0) : {analyse.partie2}")
+print(f"Plus longue serie sans toucher 0 : {analyse.plus_longue_serie}")
+print(f"Plus grand mouvement : {analyse.plus_grand_mouvement}")
+print("Histogramme des arrets :")
+for position, nombre in enumerate(analyse.histogramme):
+    print(f"{position:3d} {nombre}")
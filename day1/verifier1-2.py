@@ -0,0 +1,41 @@
+# AOC - Day1 Part 2 - Verification de l'equilibre de IndexCadran en ajout continu
+import argparse
+import math
+import random
+import sys
+import time
+
+import numpy as np
+
+from cadran import DEPART, passages_par_zero
+from index_cadran import TAILLE_FEUILLE, IndexCadran
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--ajouts", type=int, default=1_000_000, help="mouvements ajoutes en fin de journal")
+parser.add_argument("--graine", type=int, default=0)
+args = parser.parse_args()
+
+random.seed(args.graine)
+mouvements = [random.randint(-999, 999) for _ in range(args.ajouts)]
+
+index = IndexCadran()
+debut = time.perf_counter()
+for numero, mouvement in enumerate(mouvements, 1):
+    reponse, position = index.insert(len(index), mouvement)
+    if numero % 100_000 == 0:
+        print(f"\r{numero}/{args.ajouts} ajouts - profondeur {index.profondeur()}", end="", flush=True)
+duree = time.perf_counter() - debut
+print()
+
+# Un treap de n blocs a une profondeur O(log n) : 4 log2 n laisse une marge large
+nb_blocs = max(1, args.ajouts // TAILLE_FEUILLE)
+limite = 4 * math.log2(nb_blocs + 1) + 4
+attendu = passages_par_zero(np.array(mouvements, dtype=np.int64), DEPART)
+
+print(f"{args.ajouts / duree:,.0f} ajouts/s en {duree:.1f}s")
+print(f"Profondeur : {index.profondeur()} (limite {limite:.0f})")
+print(f"Index   : {reponse}, position {position}")
+print(f"Vecteur : {attendu[0]}, position {attendu[1]}")
+ok = index.profondeur() <= limite and (reponse, position) == (int(attendu[0]), int(attendu[1]))
+print("OK" if ok else "ECART")
+sys.exit(0 if ok else 1)
@@ -0,0 +1,24 @@
+# AOC - Day2 Part 2 - Index persistant des IDs invalides
+import argparse
+
+from index_invalides import IndexInvalides
+from motifs import lire_plages, normaliser_plages
+
+parser = argparse.ArgumentParser()
+commandes = parser.add_subparsers(dest="commande", required=True)
+construire = commandes.add_parser("construire", help="enumerer les IDs invalides et sauver l'index")
+construire.add_argument("dossier")
+construire.add_argument("--chiffres", type=int, default=12, help="nombre de chiffres maximum")
+requete = commandes.add_parser("requete", help="somme des IDs invalides d'un fichier de ranges")
+requete.add_argument("dossier")
+requete.add_argument("nom_fichier")
+args = parser.parse_args()
+
+if args.commande == "construire":
+    index = IndexInvalides.construire(args.dossier, args.chiffres)
+    print(f"{len(index)} IDs invalides indexes dans {args.dossier}")
+else:
+    index = IndexInvalides.charger(args.dossier)
+    plages = lire_plages(args.nom_fichier)
+    somme = sum(index.somme(start, end) for start, end, _ in normaliser_plages(plages))
+    print(f"Some des IDs invalides : {somme}")
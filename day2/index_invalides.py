@@ -0,0 +1,103 @@
+# AOC - Day2 - Index trie persistant des IDs invalides
+"""
+Tous les IDs invalides jusqu'a nb_chiffres_max chiffres, tries dans un tableau
+uint64, plus leurs sommes prefixes. Les deux tableaux sont sauves en .npy et
+relus en memory-map : une requete [start, end] = deux searchsorted.
+
+Les sommes prefixes depassent 2^64 des 19 chiffres : elles sont stockees en
+deux mots uint64, le cumul modulo 2^64 (qui deborde volontairement) et le
+nombre de debordements, recombines en entier Python exact a la requete.
+"""
+import os
+
+import numpy as np
+
+from motifs import bornes_motif, calc_multiplicateur, diviseurs, puissance_10
+
+NB_CHIFFRES_MAX = 19  # 10^19 - 1 < 2^64
+MODULE = 1 << 64
+
+
+class IndexInvalides:
+    def __init__(self, valeurs, prefixes, debordements, nb_chiffres_max):
+        self.valeurs = valeurs
+        self.prefixes = prefixes
+        self.debordements = debordements
+        self.nb_chiffres_max = nb_chiffres_max
+
+    @staticmethod
+    def fichiers(dossier):
+        return (
+            os.path.join(dossier, "invalides.npy"),
+            os.path.join(dossier, "prefixes.npy"),
+            os.path.join(dossier, "debordements.npy"),
+            os.path.join(dossier, "nb_chiffres.npy"),
+        )
+
+    @classmethod
+    def construire(cls, dossier, nb_chiffres_max=12):
+        """Enumere tous les IDs invalides de 1 a nb_chiffres_max chiffres et sauve l'index"""
+        if not 1 <= nb_chiffres_max <= NB_CHIFFRES_MAX:
+            raise ValueError(f"nb_chiffres_max doit etre entre 1 et {NB_CHIFFRES_MAX}")
+
+        morceaux = [np.zeros(0, dtype=np.uint64)]
+        for longueur in range(2, nb_chiffres_max + 1):
+            debut, fin = puissance_10(longueur - 1), puissance_10(longueur) - 1
+            for nb_rep in diviseurs(longueur):
+                taille_motif = longueur // nb_rep
+                mult = calc_multiplicateur(taille_motif, nb_rep)
+                motif_low, motif_high = bornes_motif(debut, fin, taille_motif, mult)
+                motifs = np.arange(motif_low, motif_high + 1, dtype=np.uint64)
+                morceaux.append(motifs * np.uint64(mult))
+
+        # np.unique trie et retire les IDs produits par plusieurs tailles de motif
+        valeurs = np.unique(np.concatenate(morceaux))
+        prefixes = np.zeros(len(valeurs) + 1, dtype=np.uint64)
+        np.cumsum(valeurs, out=prefixes[1:])  # deborde volontairement modulo 2^64
+        # Chaque valeur est < 2^64 : le cumul deborde au plus une fois par pas,
+        # exactement quand il redescend
+        debordements = np.zeros(len(prefixes), dtype=np.uint64)
+        np.cumsum(prefixes[1:] < prefixes[:-1], out=debordements[1:])
+
+        os.makedirs(dossier, exist_ok=True)
+        fichier_valeurs, fichier_prefixes, fichier_debordements, fichier_meta = cls.fichiers(dossier)
+        np.save(fichier_valeurs, valeurs)
+        np.save(fichier_prefixes, prefixes)
+        np.save(fichier_debordements, debordements)
+        np.save(fichier_meta, np.array(nb_chiffres_max))
+        return cls.charger(dossier)
+
+    @classmethod
+    def charger(cls, dossier):
+        fichier_valeurs, fichier_prefixes, fichier_debordements, fichier_meta = cls.fichiers(dossier)
+        return cls(
+            np.load(fichier_valeurs, mmap_mode="r"),
+            np.load(fichier_prefixes, mmap_mode="r"),
+            np.load(fichier_debordements, mmap_mode="r"),
+            int(np.load(fichier_meta)),
+        )
+
+    def __len__(self):
+        return len(self.valeurs)
+
+    def _indices(self, start, end):
+        if end >= puissance_10(self.nb_chiffres_max):
+            raise ValueError(f"{end} depasse l'index ({self.nb_chiffres_max} chiffres max)")
+        # start peut depasser 2^64 avec une plage vide : borne a 10^nb_chiffres_max
+        start = min(max(start, 0), puissance_10(self.nb_chiffres_max))
+        i = int(np.searchsorted(self.valeurs, np.uint64(start), side="left"))
+        j = int(np.searchsorted(self.valeurs, np.uint64(max(end, 0)), side="right"))
+        return i, max(i, j)
+
+    def compter(self, start, end):
+        """Nombre d'IDs invalides dans [start, end]"""
+        i, j = self._indices(start, end)
+        return j - i
+
+    def _prefixe(self, i):
+        return int(self.debordements[i]) * MODULE + int(self.prefixes[i])
+
+    def somme(self, start, end):
+        """Somme exacte des IDs invalides dans [start, end]"""
+        i, j = self._indices(start, end)
+        return self._prefixe(j) - self._prefixe(i)
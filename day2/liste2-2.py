@@ -0,0 +1,25 @@
+# AOC - Day2 Part 2 - Liste triee des IDs invalides (un par ligne, streaming)
+import argparse
+import os
+import sys
+
+from motifs import PARTIE_1, PARTIE_2, invalides_tries, lire_plages, normaliser_plages
+
+parser = argparse.ArgumentParser()
+parser.add_argument("nom_fichier", nargs="?", default="data2.txt")
+parser.add_argument("--partie", type=int, choices=(1, 2), default=2)
+args = parser.parse_args()
+
+regle = PARTIE_1 if args.partie == 1 else PARTIE_2
+
+plages = lire_plages(args.nom_fichier)
+
+# Plages normalisees : disjointes et triees, donc la sortie globale est triee
+try:
+    for start, end, _ in normaliser_plages(plages):
+        for valeur in invalides_tries(start, end, regle):
+            sys.stdout.write(f"{valeur}\n")
+    sys.stdout.flush()
+except BrokenPipeError:
+    # L'outil en aval a ferme le pipe (ex: head) : on s'arrete sans trace
+    os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
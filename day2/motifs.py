@@ -0,0 +1,529 @@
+# AOC - Day2 - IDs a motif repete, calculs sans string ops
+"""
+Un ID de L chiffres est invalide s'il est un motif de t chiffres repete L / t fois
+(t diviseur strict de L). Ces IDs s'ecrivent motif * mult, avec
+mult = 1 + 10^t + 10^2t + ... (ex: 12 * 10101 = 121212).
+"""
+import heapq
+import math
+import os
+import tempfile
+from functools import lru_cache
+from itertools import islice
+
+import numpy as np
+
+LOG10_2 = math.log10(2)
+NB_CHIFFRES_INT64 = 18  # les versions vectorisees travaillent en int64
+TAILLE_BLOC = 1 << 20  # 1 Mo lu à la fois par lire_plages
+LONGUEURS_RECHERCHE = 1000  # longueurs essayées au-delà de x par suivant()
+TAILLE_TRI = 1 << 20  # plages triées en mémoire à la fois par trier_plages
+TAILLE_BLOC_FUSION = 1 << 16  # lecture de chaque morceau trié pendant la fusion
+
+
+# Multiplicateurs calculés à la demande et mémorisés: motif * mult = pattern répété
+# Ex: 12 * 10101 = 121212 (12 répété 3 fois)
+@lru_cache(maxsize=4096)
+def calc_multiplicateur(taille_motif, nb_rep):
+    """Calcule le multiplicateur pour répéter un motif nb_rep fois"""
+    # 1 + 10^t + ... + 10^(t * (nb_rep - 1)) = (10^(t * nb_rep) - 1) / (10^t - 1)
+    return (puissance_10(taille_motif * nb_rep) - 1) // (puissance_10(taille_motif) - 1)
+
+
+@lru_cache(maxsize=4096)
+def puissance_10(n):
+    return 10**n
+
+
+def nb_chiffres(n):
+    """Nombre de chiffres de n >= 0 sans passer par str(), même pour des entiers énormes"""
+    if n < 10:
+        return 1
+    # 2^(bits - 1) <= n < 2^bits : le nombre de chiffres vaut estimation ou estimation + 1
+    estimation = int((n.bit_length() - 1) * LOG10_2) + 1
+    return estimation + 1 if n >= puissance_10(estimation) else estimation
+
+
+@lru_cache(maxsize=None)
+def diviseurs(n):
+    """Diviseurs de n supérieurs à 1 (nombres de répétitions possibles pour une longueur n)"""
+    return tuple(d for d in range(2, n + 1) if n % d == 0)
+
+
+@lru_cache(maxsize=None)
+def mobius(n):
+    """Fonction de Möbius : 0 si n a un facteur carré, sinon (-1)^(nb facteurs premiers)"""
+    resultat = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            resultat = -resultat
+        p += 1
+    return -resultat if n > 1 else resultat
+
+
+def bornes_motif(start, end, taille_motif, mult):
+    """Plage [motif_low, motif_high] des motifs de taille_motif chiffres avec start <= motif * mult <= end"""
+    motif_min = puissance_10(taille_motif - 1) if taille_motif > 1 else 1
+    motif_max = puissance_10(taille_motif)
+
+    # motif * mult >= start => motif >= start / mult
+    # motif * mult <= end => motif <= end / mult
+    motif_low = max(motif_min, (start + mult - 1) // mult)  # ceil division
+    motif_high = min(motif_max - 1, end // mult)
+    return motif_low, motif_high
+
+
+def patterns_dans_range(start, end):
+    """Génère les patterns répétitifs dans [start, end] - SANS string ops"""
+    resultats = set()
+
+    # Nombre de digits
+    len_start = nb_chiffres(start)
+    len_end = nb_chiffres(end)
+
+    for longueur in range(len_start, len_end + 1):
+        for nb_rep in diviseurs(longueur):
+            taille_motif = longueur // nb_rep
+            mult = calc_multiplicateur(taille_motif, nb_rep)
+            motif_low, motif_high = bornes_motif(start, end, taille_motif, mult)
+
+            for m in range(motif_low, motif_high + 1):
+                resultats.add(m * mult)
+
+    return resultats
+
+
+# Règles d'invalidité : prédicat (taille_motif, nb_rep) -> bool sur les découpages autorisés.
+# lru_cache : exactement(2) renvoie toujours la même fonction, les coefficients restent en cache.
+@lru_cache(maxsize=None)
+def exactement(k):
+    """Motif répété exactement k fois (partie 1 : k = 2, les deux moitiés égales)"""
+    return lambda taille_motif, nb_rep: nb_rep == k
+
+
+@lru_cache(maxsize=None)
+def au_moins(k):
+    """Motif répété au moins k fois (partie 2 : k = 2)"""
+    return lambda taille_motif, nb_rep: nb_rep >= k
+
+
+@lru_cache(maxsize=None)
+def parmi(nb_reps):
+    """Nombre de répétitions dans un ensemble donné, ex: parmi(frozenset({2, 3}))"""
+    return lambda taille_motif, nb_rep: nb_rep in nb_reps
+
+
+@lru_cache(maxsize=None)
+def motif_min(taille):
+    """Motif d'au moins taille chiffres, répété au moins 2 fois"""
+    return lambda taille_motif, nb_rep: taille_motif >= taille
+
+
+PARTIE_1 = exactement(2)
+PARTIE_2 = au_moins(2)
+
+
+@lru_cache(maxsize=None)
+def coefficients(regle, longueur):
+    """Coefficients (taille_motif, c) tels que somme = sum c * somme(S(taille_motif)).
+
+    S(t) = nombres de longueur chiffres de période t, P(p) = ceux de période
+    minimale exactement p. Les IDs invalides sont l'union disjointe des P(p)
+    pour p divisant une période t autorisée par la règle, et par inversion
+    de Möbius somme(P(p)) = sum_{d | p} mobius(p / d) * somme(S(d)).
+    Pour au_moins(2) on retrouve c(t) = -mobius(longueur / t).
+    """
+    periodes = [
+        longueur // nb_rep for nb_rep in diviseurs(longueur) if regle(longueur // nb_rep, nb_rep)
+    ]
+    primitives = {p for t in periodes for p in range(1, t + 1) if t % p == 0}
+
+    cumul = {}
+    for p in primitives:
+        for d in range(1, p + 1):
+            if p % d == 0:
+                cumul[d] = cumul.get(d, 0) + mobius(p // d)
+    return tuple((taille_motif, c) for taille_motif, c in sorted(cumul.items()) if c)
+
+
+def compter_longueur(start, end, longueur, regle=PARTIE_2):
+    """(nombre, somme) des IDs invalides de longueur chiffres dans [start, end], en forme close.
+
+    Pour une longueur L, l'ensemble S(t) des nombres de période t dans la plage
+    est une progression motif * mult : sa somme vaut mult * (somme des motifs).
+    Les chevauchements entre tailles de motif sont retirés par les coefficients
+    de Möbius de la règle (voir coefficients) : O(chiffres²), sans énumérer.
+    """
+    nombre = total = 0
+
+    for taille_motif, coefficient in coefficients(regle, longueur):
+        mult = calc_multiplicateur(taille_motif, longueur // taille_motif)
+        motif_low, motif_high = bornes_motif(start, end, taille_motif, mult)
+        if motif_high < motif_low:
+            continue
+
+        # somme(motif_low..motif_high) par la formule de Gauss
+        nb_motifs = motif_high - motif_low + 1
+        nombre += coefficient * nb_motifs
+        total += coefficient * mult * ((motif_low + motif_high) * nb_motifs // 2)
+
+    return nombre, total
+
+
+def somme_longueur(start, end, longueur, regle=PARTIE_2):
+    """Somme des IDs invalides de longueur chiffres dans [start, end]"""
+    return compter_longueur(start, end, longueur, regle)[1]
+
+
+def compter_invalides(start, end, regle=PARTIE_2):
+    """(nombre, somme) des IDs invalides dans [start, end] sans énumérer : O(chiffres²)"""
+    nombre = total = 0
+    for debut, fin, longueur in decouper_par_longueur([(start, end)]):
+        n, s = compter_longueur(debut, fin, longueur, regle)
+        nombre += n
+        total += s
+    return nombre, total
+
+
+def somme_dans_range(start, end, regle=PARTIE_2):
+    """Somme des IDs invalides dans [start, end] sans énumérer : O(chiffres²)"""
+    return compter_invalides(start, end, regle)[1]
+
+
+def lister_invalides(start, end, regle=PARTIE_2):
+    """Générateur des IDs invalides de [start, end], sans set ni string ops.
+
+    Longueur par longueur (donc par ordre croissant de longueur, mais pas
+    trié à l'intérieur d'une longueur). Un ID de période t n'est produit que
+    s'il n'est pas déjà multiple d'un multiplicateur de période vu avant :
+    pour un nombre de L chiffres, être de période t <=> être divisible par mult(t).
+    """
+    for debut, fin, longueur in decouper_par_longueur([(start, end)]):
+        deja_vus = []
+        for nb_rep in diviseurs(longueur):
+            taille_motif = longueur // nb_rep
+            if not regle(taille_motif, nb_rep):
+                continue
+            mult = calc_multiplicateur(taille_motif, nb_rep)
+            motif_low, motif_high = bornes_motif(debut, fin, taille_motif, mult)
+            for m in range(motif_low, motif_high + 1):
+                valeur = m * mult
+                if all(valeur % autre for autre in deja_vus):
+                    yield valeur
+            deja_vus.append(mult)
+
+
+def periodes_maximales(regle, longueur):
+    """Tailles de motif autorisées qui ne divisent aucune autre taille autorisée.
+
+    S(t) ⊂ S(t') quand t divise t' : seules ces périodes sont utiles pour énumérer.
+    """
+    tailles = [
+        longueur // nb_rep for nb_rep in diviseurs(longueur) if regle(longueur // nb_rep, nb_rep)
+    ]
+    return [t for t in tailles if not any(autre != t and autre % t == 0 for autre in tailles)]
+
+
+def invalides_tries(start, end, regle=PARTIE_2):
+    """Générateur des IDs invalides de [start, end] par ordre croissant, sans set.
+
+    Chaque période t donne une progression arithmétique motif * mult (raison mult).
+    Les progressions d'une même longueur sont fusionnées avec un tas et les
+    doublons (IDs de plusieurs périodes) sautés au vol : mémoire O(nombre de progressions).
+    """
+    for debut, fin, longueur in decouper_par_longueur([(start, end)]):
+        tas = []
+        for taille_motif in periodes_maximales(regle, longueur):
+            mult = calc_multiplicateur(taille_motif, longueur // taille_motif)
+            motif_low, motif_high = bornes_motif(debut, fin, taille_motif, mult)
+            if motif_low <= motif_high:
+                tas.append((motif_low * mult, mult, motif_high * mult))
+        heapq.heapify(tas)
+
+        dernier = None
+        while tas:
+            valeur, mult, valeur_max = tas[0]
+            if valeur != dernier:
+                yield valeur
+                dernier = valeur
+            if valeur < valeur_max:
+                heapq.heapreplace(tas, (valeur + mult, mult, valeur_max))
+            else:
+                heapq.heappop(tas)
+
+
+def _motif_min(taille_motif):
+    return puissance_10(taille_motif - 1) if taille_motif > 1 else 1
+
+
+def suivant(x, regle=PARTIE_2):
+    """Plus petit ID invalide >= x (None si aucun dans les LONGUEURS_RECHERCHE longueurs suivantes).
+
+    Pour chaque période maximale t, le premier motif m >= ceil(x / mult) donne
+    un candidat : O(chiffres²) au total, exact pour des entiers arbitraires.
+    """
+    x = max(x, 1)
+    longueur = nb_chiffres(x)
+    for longueur in range(longueur, longueur + LONGUEURS_RECHERCHE):
+        x = max(x, puissance_10(longueur - 1))
+        candidats = []
+        for taille_motif in periodes_maximales(regle, longueur):
+            mult = calc_multiplicateur(taille_motif, longueur // taille_motif)
+            motif = max(_motif_min(taille_motif), (x + mult - 1) // mult)
+            if motif < puissance_10(taille_motif):
+                candidats.append(motif * mult)
+        if candidats:
+            return min(candidats)
+    return None
+
+
+def precedent(x, regle=PARTIE_2):
+    """Plus grand ID invalide <= x (None s'il n'y en a pas)"""
+    if x < 1:
+        return None
+    for longueur in range(nb_chiffres(x), 0, -1):
+        x = min(x, puissance_10(longueur) - 1)
+        candidats = []
+        for taille_motif in periodes_maximales(regle, longueur):
+            mult = calc_multiplicateur(taille_motif, longueur // taille_motif)
+            motif = min(puissance_10(taille_motif) - 1, x // mult)
+            if motif >= _motif_min(taille_motif):
+                candidats.append(motif * mult)
+        if candidats:
+            return max(candidats)
+    return None
+
+
+def kieme(a, b, k, regle=PARTIE_2):
+    """k-ième (à partir de 1) ID invalide de [a, b], None si la plage en contient moins de k.
+
+    On trouve d'abord la longueur qui le contient avec les comptes en forme close,
+    puis on dichotomise sur la valeur dans cette longueur (compter_longueur est monotone).
+
+    Coût pour des bornes de L chiffres : environ log2(10^L) ≈ 3.3 L appels à
+    compter_longueur, chacun O(L²) (divisions d'entiers de L chiffres pour chaque
+    taille de motif), soit O(L³) au total, et non O(L²). L'inclusion-exclusion
+    entre tailles de motif empêche de choisir directement le k-ième motif d'une
+    seule progression.
+    """
+    if k < 1:
+        return None
+    for debut, fin, longueur in decouper_par_longueur([(a, b)]):
+        nombre = compter_longueur(debut, fin, longueur, regle)[0]
+        if k > nombre:
+            k -= nombre
+            continue
+        bas, haut = debut, fin
+        while bas < haut:
+            milieu = (bas + haut) // 2
+            if compter_longueur(debut, milieu, longueur, regle)[0] >= k:
+                haut = milieu
+            else:
+                bas = milieu + 1
+        return bas
+    return None
+
+
+def suivants(xs, regle=PARTIE_2):
+    """Version vectorisée de suivant : -1 quand il n'y a pas de réponse.
+
+    Tableau int64 ou dtype=object pour des entiers Python arbitraires, exacts.
+    En int64 seules les réponses de 18 chiffres au plus sont cherchées : -1
+    veut alors dire « pas de réponse » ou « réponse hors int64 » (x de 19 chiffres
+    compris) ; passer en dtype=object pour distinguer les deux. Le résultat d'un
+    x ne dépend pas des autres valeurs du lot :
+
+    >>> suivants(np.array([1, 10**17, 2**63 - 10**8, 2**63 - 1])).tolist()
+    [11, 100000000100000000, -1, -1]
+    """
+    xs = np.asarray(xs)
+    exact = xs.dtype == object
+    xs = np.maximum(xs, 1)
+    resultats = np.full(xs.shape, -1, dtype=xs.dtype)
+    if not xs.size:
+        return resultats
+
+    premiere = nb_chiffres(int(xs.min()))
+    derniere = nb_chiffres(int(xs.max())) + LONGUEURS_RECHERCHE
+    if not exact:
+        derniere = min(derniere, NB_CHIFFRES_INT64)
+
+    restants = np.ones(xs.shape, dtype=bool)
+    for longueur in range(premiere, derniere + 1):
+        y = np.maximum(xs, puissance_10(longueur - 1))
+        # Un x de plus de longueur chiffres n'a pas de réponse à cette longueur
+        trop_longs = (xs >= puissance_10(longueur)).astype(bool)
+        meilleurs = np.full(xs.shape, -1, dtype=xs.dtype)
+        for taille_motif in periodes_maximales(regle, longueur):
+            mult = calc_multiplicateur(taille_motif, longueur // taille_motif)
+            # Plafond de y / mult sans calculer y + mult - 1, qui déborde près de int64.max
+            motifs = np.maximum(_motif_min(taille_motif), (y - 1) // mult + 1)
+            valides = (motifs < puissance_10(taille_motif)).astype(bool) & ~trop_longs
+            candidats = np.where(valides, motifs * mult, -1)
+            remplacer = valides & ((meilleurs < 0) | (candidats < meilleurs)).astype(bool)
+            meilleurs = np.where(remplacer, candidats, meilleurs)
+
+        trouves = restants & (meilleurs >= 0).astype(bool)
+        resultats = np.where(trouves, meilleurs, resultats)
+        restants &= ~trouves
+        if not restants.any():
+            break
+
+    return resultats
+
+
+def precedents(xs, regle=PARTIE_2):
+    """Version vectorisée de precedent : -1 quand il n'y a pas de réponse.
+
+    La réponse est <= x : elle tient toujours dans le dtype de xs.
+    """
+    xs = np.asarray(xs)
+    resultats = np.full(xs.shape, -1, dtype=xs.dtype)
+    if not xs.size or int(xs.max()) < 1:
+        return resultats
+
+    # 10^19 - 1 ne tient pas en int64 : on borne y au plus grand entier du dtype
+    plafond = None if xs.dtype == object else int(np.iinfo(xs.dtype).max)
+    restants = (xs >= 1).astype(bool)
+    for longueur in range(nb_chiffres(int(xs.max())), 0, -1):
+        borne = puissance_10(longueur) - 1
+        y = np.minimum(xs, borne if plafond is None else min(borne, plafond))
+        meilleurs = np.full(xs.shape, -1, dtype=xs.dtype)
+        for taille_motif in periodes_maximales(regle, longueur):
+            mult = calc_multiplicateur(taille_motif, longueur // taille_motif)
+            motifs = np.minimum(puissance_10(taille_motif) - 1, y // mult)
+            candidats = np.where((motifs >= _motif_min(taille_motif)).astype(bool), motifs * mult, -1)
+            meilleurs = np.maximum(meilleurs, candidats)
+
+        trouves = restants & (meilleurs >= 0).astype(bool)
+        resultats = np.where(trouves, meilleurs, resultats)
+        restants &= ~trouves
+        if not restants.any():
+            break
+
+    return resultats
+
+
+def lire_plages(nom_fichier, taille_bloc=TAILLE_BLOC):
+    """Générateur des plages (start, end) de '11-22,95-115,...' lues par blocs d'octets.
+
+    Le token coupé en fin de bloc est gardé et recollé au bloc suivant : la
+    mémoire reste bornée par taille_bloc même pour une ligne de plusieurs Go.
+    """
+    reste = b""
+    with open(nom_fichier, "rb") as f:
+        while bloc := f.read(taille_bloc):
+            tokens = (reste + bloc).replace(b"\n", b",").split(b",")
+            reste = tokens.pop()
+            for token in tokens:
+                if token.strip():
+                    debut, fin = token.split(b"-")
+                    yield int(debut), int(fin)
+    if reste.strip():
+        debut, fin = reste.split(b"-")
+        yield int(debut), int(fin)
+
+
+def trier_plages(plages, taille_tri=TAILLE_TRI):
+    """Générateur des plages triées, avec au plus taille_tri plages en mémoire.
+
+    Une entrée plus longue est triée par morceaux écrits dans des fichiers
+    temporaires ('start-end' par ligne), relus avec lire_plages et fusionnés
+    par heapq.merge : la mémoire reste bornée quel que soit le nombre de plages.
+    """
+    plages = iter(plages)
+    morceau = sorted(islice(plages, taille_tri))
+    if len(morceau) < taille_tri:
+        yield from morceau
+        return
+
+    with tempfile.TemporaryDirectory() as dossier:
+        fichiers = []
+        while morceau:
+            fichiers.append(os.path.join(dossier, f"{len(fichiers)}.txt"))
+            with open(fichiers[-1], "w") as f:
+                f.writelines(f"{start}-{end}\n" for start, end in morceau)
+            morceau = sorted(islice(plages, taille_tri))
+        yield from heapq.merge(*(lire_plages(nom, TAILLE_BLOC_FUSION) for nom in fichiers))
+
+
+def fusionner_plages(plages):
+    """Trie les plages et fusionne celles qui se chevauchent ou se touchent.
+
+    Les plages obtenues sont disjointes : plus besoin de set pour dédupliquer.
+    Le tri passe par trier_plages, en mémoire bornée.
+    """
+    courante = None
+    for start, end in trier_plages(plages):
+        if courante is not None and start <= courante[1] + 1:
+            courante[1] = max(courante[1], end)
+            continue
+        if courante is not None:
+            yield tuple(courante)
+        courante = [start, end]
+    if courante is not None:
+        yield tuple(courante)
+
+
+def decouper_par_longueur(plages):
+    """Coupe chaque plage aux puissances de 10 : (start, end, longueur) à nombre de chiffres fixe"""
+    for start, end in plages:
+        longueur = nb_chiffres(start)
+        while start <= end:
+            fin_longueur = min(end, puissance_10(longueur) - 1)
+            yield start, fin_longueur, longueur
+            start = fin_longueur + 1
+            longueur += 1
+
+
+def normaliser_plages(plages):
+    """Plages fusionnées puis découpées par longueur, prêtes pour somme_longueur"""
+    return decouper_par_longueur(fusionner_plages(plages))
+
+
+def compter_et_sommer(starts, ends, regle=PARTIE_2):
+    """Version vectorisée sur des tableaux de plages : (nombres, sommes) d'IDs invalides par plage.
+
+    Mêmes coefficients que compter_longueur, mais chaque couple
+    (longueur, taille_motif) est évalué d'un coup pour toutes les plages.
+    Calcul en int64 : les bornes doivent avoir au plus 18 chiffres, et
+    ValueError si une somme peut dépasser 2^63 - 1 (nombre * end trop grand),
+    plutôt que de renvoyer une somme débordée (utiliser alors compter_invalides) :
+
+    >>> compter_et_sommer([10**17], [10**18 - 1])
+    Traceback (most recent call last):
+    ...
+    ValueError: somme possiblement hors int64 pour la plage [100000000000000000, 999999999999999999]
+    """
+    starts = np.maximum(np.asarray(starts, dtype=np.int64), 0)
+    ends = np.asarray(ends, dtype=np.int64)
+    nombres = np.zeros(starts.shape, dtype=np.int64)
+    sommes = np.zeros(starts.shape, dtype=np.int64)
+    if not ends.size:
+        return nombres, sommes
+    if ends.max() >= puissance_10(NB_CHIFFRES_INT64):
+        raise ValueError(f"bornes limitées à {NB_CHIFFRES_INT64} chiffres en version vectorisée")
+
+    for longueur in range(nb_chiffres(int(starts.min())), nb_chiffres(int(ends.max())) + 1):
+        for taille_motif, coefficient in coefficients(regle, longueur):
+            mult = calc_multiplicateur(taille_motif, longueur // taille_motif)
+            motif_min = puissance_10(taille_motif - 1) if taille_motif > 1 else 1
+            motif_low = np.maximum(motif_min, (starts + mult - 1) // mult)
+            motif_high = np.minimum(puissance_10(taille_motif) - 1, ends // mult)
+
+            nb_motifs = np.maximum(motif_high - motif_low + 1, 0)
+            nombres += coefficient * nb_motifs
+            sommes += coefficient * mult * ((motif_low + motif_high) * nb_motifs // 2)
+
+    # Somme <= nombre * end : les termes intermédiaires débordent modulo 2^64
+    # sans effet sur le résultat tant que celui-ci tient sur 63 bits
+    hors_int64 = np.flatnonzero(nombres > np.iinfo(np.int64).max // np.maximum(ends, 1))
+    if len(hors_int64):
+        i = hors_int64[0]
+        raise ValueError(f"somme possiblement hors int64 pour la plage [{starts[i]}, {ends[i]}]")
+
+    return nombres, sommes
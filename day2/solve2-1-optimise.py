@@ -0,0 +1,16 @@
+# AOC - Day2 Part 1 - Optimise (no string ops, forme close)
+import sys
+
+from motifs import PARTIE_1, lire_plages, normaliser_plages, somme_longueur
+
+nom_fichier = sys.argv[1] if len(sys.argv) > 1 else "data2.txt"
+
+plages = lire_plages(nom_fichier)
+
+# Partie 1 : motif répété exactement 2 fois (les deux moitiés égales)
+somme = sum(
+    somme_longueur(start, end, longueur, PARTIE_1)
+    for start, end, longueur in normaliser_plages(plages)
+)
+
+print(somme)
@@ -2,20 +2,13 @@
 
 import sys
 
-nom_fichier = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
-
-with open(nom_fichier) as f:
-    data = f.read().strip()
-    lignes = data.splitlines()
+from motifs import lire_plages
 
-data = lignes[0].split(",")
+nom_fichier = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
 
 doublon = []
-for donnee in data:
-    range_data = donnee.split("-")
-    start = int(range_data[0])
-    end = int(range_data[1])
-
+# Lecture en streaming des ranges (start, end)
+for start, end in lire_plages(nom_fichier):
     for i in range(start, end + 1):
         number_to_string = str(i)
         longueur_totale = len(number_to_string)
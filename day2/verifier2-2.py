@@ -0,0 +1,76 @@
+# AOC - Day2 Part 2 - Verification brute force parallele contre le moteur optimise
+import argparse
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from motifs import lire_plages, normaliser_plages, somme_longueur
+
+
+def est_invalide(i):
+    """Le test de reference de solve2-2.py : motif * nb_repetitions == number_to_string"""
+    number_to_string = str(i)
+    longueur_totale = len(number_to_string)
+    for taille_motif in range(1, (longueur_totale // 2) + 1):
+        if longueur_totale % taille_motif != 0:
+            continue
+        motif = number_to_string[:taille_motif]
+        nb_repetitions = longueur_totale // taille_motif
+        if motif * nb_repetitions == number_to_string:
+            return True
+    return False
+
+
+def verifier_morceau(start, end):
+    """Somme brute force de [start, end], avec le temps passe et le pid du worker"""
+    debut = time.perf_counter()
+    somme = sum(i for i in range(start, end + 1) if est_invalide(i))
+    return somme, end - start + 1, time.perf_counter() - debut, os.getpid()
+
+
+def decouper(plages, taille_morceau):
+    for start, end, _ in plages:
+        for debut in range(start, end + 1, taille_morceau):
+            yield debut, min(end, debut + taille_morceau - 1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("nom_fichier", nargs="?", default="data2.txt")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--taille-morceau", type=int, default=1_000_000, help="IDs par tache")
+    args = parser.parse_args()
+
+    plages = list(normaliser_plages(lire_plages(args.nom_fichier)))
+
+    attendu = sum(somme_longueur(start, end, longueur) for start, end, longueur in plages)
+    morceaux = list(decouper(plages, args.taille_morceau))
+    total_ids = sum(end - start + 1 for start, end in morceaux)
+
+    somme = ids_faits = 0
+    ids_par_worker = defaultdict(int)
+    temps_par_worker = defaultdict(float)
+    debut = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = [executor.submit(verifier_morceau, start, end) for start, end in morceaux]
+        # Sommes partielles remontees au fil de l'eau
+        for future in as_completed(futures):
+            somme_morceau, nb_ids, duree, pid = future.result()
+            somme += somme_morceau
+            ids_faits += nb_ids
+            ids_par_worker[pid] += nb_ids
+            temps_par_worker[pid] += duree
+            print(f"\r{ids_faits}/{total_ids} IDs - somme partielle {somme}", end="", flush=True)
+
+    duree_totale = time.perf_counter() - debut
+    print()
+    for pid in sorted(ids_par_worker):
+        debit = ids_par_worker[pid] / temps_par_worker[pid] if temps_par_worker[pid] else 0
+        print(f"worker {pid} : {ids_par_worker[pid]} IDs, {debit:,.0f} IDs/s")
+    print(f"total : {total_ids / duree_totale:,.0f} IDs/s en {duree_totale:.1f}s")
+
+    print(f"Brute force : {somme}")
+    print(f"Optimise    : {attendu}")
+    print("OK" if somme == attendu else "ECART")
@@ -6,6 +6,11 @@ Change DATA_FILE below to use a different input file.
 """
 from manim import *
 import os
+import sys
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from plat import SEUIL, cases, charger_plat, compter_voisins, decalages, position
 
 # ============== CONFIGURATION ==============
 DATA_FILE = os.environ.get("DATA_FILE", "data4-test.txt")
@@ -49,10 +54,10 @@ class PaperRemovalAnimation(Scene):
         squares = [[None for _ in range(cols)] for _ in range(rows)]
         count_labels = [[None for _ in range(cols)] for _ in range(rows)]
 
-        # Data structures (mirroring the algorithm)
-        grid = [[0] * (cols + 2) for _ in range(rows + 2)]
-        counts = [[0] * (cols + 2) for _ in range(rows + 2)]
-        deltas = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+        # Data structures (mirroring the algorithm): flat padded grid, one index per cell
+        grille = charger_plat(DATA_FILE)
+        grid = grille.occupe
+        voisins = decalages(grille.pas)
 
         # Build visual grid
         for r in range(rows):
@@ -74,10 +79,6 @@ class PaperRemovalAnimation(Scene):
                 squares[r][c] = square
                 grid_group.add(square)
 
-                # Initialize algorithm data
-                if is_paper:
-                    grid[r+1][c+1] = 1
-
         # Show initial grid (faster for large grids)
         grid_anim_time = 1.0 if rows > 50 else 2.0
         self.play(
@@ -98,18 +99,16 @@ class PaperRemovalAnimation(Scene):
 
         # Calculate and display neighbor counts
         count_group = VGroup()
-        for r in range(1, rows + 1):
-            for c in range(1, cols + 1):
-                if grid[r][c] == 1:
-                    n_count = sum(grid[r + dr][c + dc] for dr, dc in deltas)
-                    counts[r][c] = n_count
-
-                    # Visual: show count on each paper (only for small grids)
-                    if SHOW_COUNTS:
-                        label = Text(str(n_count), font_size=14, color=WHITE)
-                        label.move_to(squares[r-1][c-1].get_center())
-                        count_labels[r-1][c-1] = label
-                        count_group.add(label)
+        counts = compter_voisins(grille)
+        for i in cases(grille):
+            if grid[i] == 1:
+                # Visual: show count on each paper (only for small grids)
+                if SHOW_COUNTS:
+                    r, c = position(grille, i)
+                    label = Text(str(counts[i]), font_size=14, color=WHITE)
+                    label.move_to(squares[r][c].get_center())
+                    count_labels[r][c] = label
+                    count_group.add(label)
 
         if SHOW_COUNTS:
             self.play(FadeIn(count_group, lag_ratio=0.02), run_time=1.5)
@@ -122,17 +121,17 @@ class PaperRemovalAnimation(Scene):
         step3.to_edge(DOWN, buff=0.2)
         self.play(Transform(step1, step3))
 
-        stack = []
+        stack = array("l")
         highlight_anims = []
 
-        for r in range(1, rows + 1):
-            for c in range(1, cols + 1):
-                if grid[r][c] == 1 and counts[r][c] < 4:
-                    stack.append((r, c))
-                    grid[r][c] = 0  # Mark as queued
-                    highlight_anims.append(
-                        squares[r-1][c-1].animate.set_fill(LOW_NEIGHBOR_COLOR, opacity=1)
-                    )
+        for i in cases(grille):
+            if grid[i] == 1 and counts[i] < SEUIL:
+                stack.append(i)
+                grid[i] = 0  # Mark as queued
+                r, c = position(grille, i)
+                highlight_anims.append(
+                    squares[r][c].animate.set_fill(LOW_NEIGHBOR_COLOR, opacity=1)
+                )
 
         if highlight_anims:
             self.play(*highlight_anims, run_time=1)
@@ -163,14 +162,15 @@ class PaperRemovalAnimation(Scene):
             wave_count += 1
 
             # Take current batch
-            current_batch = stack.copy()
-            stack.clear()
+            current_batch = [position(grille, i) for i in stack]
+            batch_indices = stack
+            stack = array("l")
 
             # For large grids, combine highlight + remove in one step
             if LARGE_GRID:
                 # Direct to red (removing)
                 remove_anims = [
-                    squares[r-1][c-1].animate.set_fill(REMOVING_COLOR, opacity=0.8)
+                    squares[r][c].animate.set_fill(REMOVING_COLOR, opacity=0.8)
                     for r, c in current_batch
                 ]
                 if remove_anims:
@@ -180,17 +180,17 @@ class PaperRemovalAnimation(Scene):
                 remove_anims = []
                 for r, c in current_batch:
                     remove_anims.append(
-                        squares[r-1][c-1].animate.set_fill(REMOVING_COLOR, opacity=0.8)
+                        squares[r][c].animate.set_fill(REMOVING_COLOR, opacity=0.8)
                     )
-                    if count_labels[r-1][c-1]:
-                        remove_anims.append(FadeOut(count_labels[r-1][c-1]))
+                    if count_labels[r][c]:
+                        remove_anims.append(FadeOut(count_labels[r][c]))
 
                 if remove_anims:
                     self.play(*remove_anims, run_time=ANIM_SPEED)
 
             # Fade out removed papers
             fadeout_anims = [
-                squares[r-1][c-1].animate.set_fill(GRAY, opacity=0.1)
+                squares[r][c].animate.set_fill(GRAY, opacity=0.1)
                 for r, c in current_batch
             ]
 
@@ -209,30 +209,31 @@ class PaperRemovalAnimation(Scene):
             new_low_neighbors = []
             update_anims = []
 
-            for r, c in current_batch:
-                for dr, dc in deltas:
-                    nr, nc = r + dr, c + dc
-
-                    if 1 <= nr <= rows and 1 <= nc <= cols:
-                        if grid[nr][nc] == 1:
-                            counts[nr][nc] -= 1
-
-                            # Update visual count (only for small grids)
-                            if SHOW_COUNTS and count_labels[nr-1][nc-1]:
-                                old_label = count_labels[nr-1][nc-1]
-                                new_label = Text(
-                                    str(counts[nr][nc]),
-                                    font_size=14,
-                                    color=RED if counts[nr][nc] < 4 else WHITE
-                                )
-                                new_label.move_to(old_label.get_center())
-                                update_anims.append(Transform(old_label, new_label))
-
-                            # Check if now below threshold
-                            if counts[nr][nc] == 3:
-                                stack.append((nr, nc))
-                                grid[nr][nc] = 0
-                                new_low_neighbors.append((nr, nc))
+            for i in batch_indices:
+                for d in voisins:
+                    j = i + d
+
+                    # The padding is never paper: no bounds check needed
+                    if grid[j] == 1:
+                        counts[j] -= 1
+                        nr, nc = position(grille, j)
+
+                        # Update visual count (only for small grids)
+                        if SHOW_COUNTS and count_labels[nr][nc]:
+                            old_label = count_labels[nr][nc]
+                            new_label = Text(
+                                str(counts[j]),
+                                font_size=14,
+                                color=RED if counts[j] < SEUIL else WHITE
+                            )
+                            new_label.move_to(old_label.get_center())
+                            update_anims.append(Transform(old_label, new_label))
+
+                        # Check if now below threshold
+                        if counts[j] == SEUIL - 1:
+                            stack.append(j)
+                            grid[j] = 0
+                            new_low_neighbors.append((nr, nc))
 
             if update_anims:
                 self.play(*update_anims, run_time=ANIM_SPEED * 0.8)
@@ -240,7 +241,7 @@ class PaperRemovalAnimation(Scene):
             # Highlight new papers that will be removed
             if new_low_neighbors and not LARGE_GRID:
                 highlight_new = [
-                    squares[r-1][c-1].animate.set_fill(LOW_NEIGHBOR_COLOR, opacity=1)
+                    squares[r][c].animate.set_fill(LOW_NEIGHBOR_COLOR, opacity=1)
                     for r, c in new_low_neighbors
                 ]
                 self.play(*highlight_new, run_time=ANIM_SPEED * 0.6)
@@ -0,0 +1,88 @@
+# AOC - Day4 - Grille en lignes de bits (un entier Python par ligne)
+"""
+Chaque ligne est un entier : bit c = 1 si la colonne c contient un papier.
+Les 8 voisins d'une ligne sont ses voisines haut/bas decalees de -1, 0, +1
+et elle-meme decalee de -1, +1. Un additionneur "bit-sliced" compte les
+voisins de toutes les colonnes a la fois, mot machine par mot machine,
+pour environ 1 bit par case au lieu d'un pointeur + int par case.
+"""
+TABLE = str.maketrans("@.", "10")
+SEUIL = 4
+
+
+def charger_lignes(nom_fichier):
+    """Lit la grille ligne par ligne : (liste d'entiers, nombre de colonnes)"""
+    lignes = []
+    cols = 0
+    with open(nom_fichier) as f:
+        for ligne in f:
+            ligne = ligne.strip()
+            if not ligne:
+                continue
+            cols = len(ligne)
+            # Colonne 0 = bit de poids faible
+            lignes.append(int(ligne.translate(TABLE)[::-1], 2))
+    return lignes, cols
+
+
+def _additionneur(a, b, c):
+    """Additionneur complet sur tous les bits a la fois : (somme, retenue)"""
+    return a ^ b ^ c, (a & b) | (c & (a ^ b))
+
+
+def au_moins_4(x0, x1, x2, x3, x4, x5, x6, x7):
+    """Masque des colonnes ou au moins 4 des 8 entrees valent 1.
+
+    x0+x1+x2 = a + 2*b1, x3+x4+x5 = c + 2*b2, x6+x7 = d + 2*b3, a+c+d = _ + 2*b4,
+    b1+b2+b3 = e + 2*f1, e+b4 = _ + 2*f2 : le total vaut >= 4 ssi f1 ou f2.
+    """
+    a, b1 = _additionneur(x0, x1, x2)
+    c, b2 = _additionneur(x3, x4, x5)
+    d, b3 = x6 ^ x7, x6 & x7
+    b4 = (a & c) | (d & (a ^ c))
+    e, f1 = _additionneur(b1, b2, b3)
+    return f1 | (e & b4)
+
+
+def masque_accessibles(haut, ligne, bas, plein):
+    """Papiers de ligne avec moins de SEUIL voisins (haut/bas = lignes voisines, 0 hors grille)"""
+    voisins_pleins = au_moins_4(
+        (haut << 1) & plein, haut, haut >> 1,
+        (ligne << 1) & plein, ligne >> 1,
+        (bas << 1) & plein, bas, bas >> 1,
+    )
+    return ligne & ~voisins_pleins
+
+
+def _masque(lignes, r, plein):
+    haut = lignes[r - 1] if r > 0 else 0
+    bas = lignes[r + 1] if r + 1 < len(lignes) else 0
+    return masque_accessibles(haut, lignes[r], bas, plein)
+
+
+def compter_accessibles(lignes, cols):
+    """Partie 1 : nombre de papiers avec moins de SEUIL voisins"""
+    plein = (1 << cols) - 1
+    return sum(_masque(lignes, r, plein).bit_count() for r in range(len(lignes)))
+
+
+def retirer_tout(lignes, cols):
+    """Partie 2 : retire par vagues les papiers accessibles jusqu'a stabilite (modifie lignes).
+
+    Seules les lignes voisines d'une ligne modifiee sont reexaminees a la vague suivante.
+    """
+    plein = (1 << cols) - 1
+    total = 0
+    a_revoir = set(range(len(lignes)))
+    while a_revoir:
+        retraits = {}
+        for r in sorted(a_revoir):
+            masque = _masque(lignes, r, plein)
+            if masque:
+                retraits[r] = masque
+        a_revoir = set()
+        for r, masque in retraits.items():
+            lignes[r] &= ~masque
+            total += masque.bit_count()
+            a_revoir.update(v for v in (r - 1, r, r + 1) if 0 <= v < len(lignes))
+    return total
@@ -0,0 +1,192 @@
+# AOC - Day4 - Moteur vectorise (NumPy)
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+SEUIL = 4  # un papier avec moins de SEUIL voisins est accessible
+DECALAGES = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+def charger_grille(nom_fichier):
+    """Grille uint8 (1 = papier '@') avec une bordure de 0 pour eviter les checks de bords"""
+    with open(nom_fichier, "rb") as f:
+        octets = np.frombuffer(f.read(), dtype=np.uint8)
+
+    # Seuls '@' et '.' sont des cases : fins de ligne (\n, \r\n) et espaces ignores
+    est_case = (octets == ord("@")) | (octets == ord("."))
+    fins = np.flatnonzero(octets == ord("\n"))
+    cols = int(np.count_nonzero(est_case[: fins[0]] if len(fins) else est_case))
+    cases = octets[est_case]
+    rows = len(cases) // cols if cols else 0
+
+    grille = np.zeros((rows + 2, cols + 2), dtype=np.uint8)
+    grille[1:-1, 1:-1] = cases.reshape(rows, cols) == ord("@")
+    return grille
+
+
+def compter_voisins(grille):
+    """Nombre de voisins (8 directions) de chaque case interieure : 8 additions de tranches decalees"""
+    rows, cols = grille.shape[0] - 2, grille.shape[1] - 2
+    counts = np.zeros((rows, cols), dtype=np.uint8)
+    for dr, dc in DECALAGES:
+        counts += grille[1 + dr : rows + 1 + dr, 1 + dc : cols + 1 + dc]
+    return counts
+
+
+def accessibles(grille):
+    """Masque des papiers avec moins de SEUIL voisins"""
+    return (grille[1:-1, 1:-1] == 1) & (compter_voisins(grille) < SEUIL)
+
+
+def peler_sur_place(grille):
+    """Retire par vagues les papiers accessibles de l'interieur de grille, sur place.
+
+    La bordure n'est jamais retiree : bordure de 0 pour une grille complete,
+    ou halo fige d'une tuile (voir tuiles.py). Renvoie la taille de chaque vague.
+    """
+    interieur = grille[1:-1, 1:-1]
+    counts = compter_voisins(grille)
+    retrait = np.zeros_like(grille)
+    tailles = []
+
+    frontiere = (interieur == 1) & (counts < SEUIL)
+    while frontiere.any():
+        tailles.append(int(np.count_nonzero(frontiere)))
+        interieur[frontiere] = 0
+        retrait[1:-1, 1:-1] = frontiere
+        counts -= compter_voisins(retrait)
+        frontiere = (interieur == 1) & (counts < SEUIL)
+
+    return tailles
+
+
+def peler_par_vagues(grille):
+    """Partie 2 : retire par vagues tous les papiers accessibles jusqu'a stabilite.
+
+    Chaque vague retire d'un coup toute la frontiere (papiers avec < SEUIL voisins),
+    puis soustrait aux compteurs le nombre de voisins retires, calcule comme
+    compter_voisins sur le masque de retrait. Les vagues correspondent aux
+    lots successifs de anim4-2.py. Renvoie (total, taille de chaque vague).
+    """
+    tailles = peler_sur_place(grille.copy())
+    return sum(tailles), tailles
+
+
+_partagee = None  # (memoire, grille, compteurs) partages, attaches une fois par worker
+
+
+def _attacher(nom, forme):
+    global _partagee
+    memoire = shared_memory.SharedMemory(name=nom)
+    taille = forme[0] * forme[1]
+    grille = np.ndarray(forme, dtype=np.uint8, buffer=memoire.buf)
+    counts = np.ndarray(forme, dtype=np.uint8, buffer=memoire.buf, offset=taille)
+    _partagee = (memoire, grille, counts)
+
+
+def compter_bande(debut, fin):
+    """Compteurs de voisins des lignes [debut, fin), avant tout retrait"""
+    _, grille, counts = _partagee
+    counts[debut:fin, 1:-1] = compter_voisins(grille[debut - 1 : fin + 1])
+
+
+def _propager(grille, counts, debut, fin, lo, frontiere, bords):
+    """Vagues de retrait dans les lignes [debut, fin) a partir d'une frontiere deja retiree.
+
+    frontiere couvre les lignes lo, lo + 1, ... (eventuellement une ligne de halo
+    d'une bande voisine) ; seules les lignes autour de chaque vague sont touchees.
+    Les retraits de la premiere et de la derniere ligne de la bande sont cumules
+    dans bords pour etre transmis aux bandes voisines. Renvoie le nombre de retraits.
+    """
+    total = 0
+    while frontiere.any():
+        hi = lo + len(frontiere)
+        retrait = np.zeros((hi - lo + 4, grille.shape[1]), dtype=np.uint8)
+        retrait[2:-2, 1:-1] = frontiere
+        baisse = compter_voisins(retrait)  # lignes lo - 1 .. hi
+
+        r0, r1 = max(lo - 1, debut), min(hi + 1, fin)
+        counts[r0:r1, 1:-1] -= baisse[r0 - lo + 1 : r1 - lo + 1]
+        zone = grille[r0:r1, 1:-1]
+        frontiere = (zone == 1) & (counts[r0:r1, 1:-1] < SEUIL)
+        zone[frontiere] = 0
+        total += int(np.count_nonzero(frontiere))
+        if r0 == debut:
+            bords[0] |= frontiere[0]
+        if r1 == fin:
+            bords[1] |= frontiere[-1]
+        lo = r0
+    return total
+
+
+def peler_bande(debut, fin, haut=None, bas=None):
+    """Pele les lignes [debut, fin) de la grille partagee.
+
+    Premier tour (haut et bas a None) : toute la bande. Tours suivants : seulement
+    les decrements dus aux retraits des lignes de halo haut (debut - 1) et bas (fin)
+    faits par les bandes voisines, puis la propagation qui en decoule.
+    Renvoie (retires, retraits de la premiere ligne, retraits de la derniere ligne).
+    """
+    _, grille, counts = _partagee
+    bords = np.zeros((2, grille.shape[1] - 2), dtype=bool)
+    if haut is None and bas is None:
+        zone = grille[debut:fin, 1:-1]
+        frontiere = (zone == 1) & (counts[debut:fin, 1:-1] < SEUIL)
+        zone[frontiere] = 0
+        bords[0], bords[1] = frontiere[0], frontiere[-1]
+        retires = int(np.count_nonzero(frontiere)) + _propager(grille, counts, debut, fin, debut, frontiere, bords)
+    else:
+        retires = 0
+        for ligne, halo in ((debut - 1, haut), (fin, bas)):
+            if halo is not None:
+                retires += _propager(grille, counts, debut, fin, ligne, halo[None, :], bords)
+    return retires, bords[0], bords[1]
+
+
+def peler_parallele(grille, workers):
+    """Partie 2 en bandes horizontales de memoire partagee, une bande par worker.
+
+    La grille et les compteurs de voisins sont partages. Apres un tour de comptage,
+    chaque bande se pele entierement ; ensuite les retraits de ses lignes de bord
+    sont transmis a ses voisines, qui n'appliquent que ces decrements au tour
+    suivant, jusqu'a ce qu'aucun bord ne bouge. Une bande ne lit jamais
+    l'occupation de ses voisines apres le comptage : pas de course entre workers.
+    Le total est celui de peler_par_vagues (l'ordre des retraits n'y change rien).
+    """
+    rows = grille.shape[0] - 2
+    hauteur = -(-rows // workers) if rows else 1
+    bandes = [(debut, min(debut + hauteur, rows + 1)) for debut in range(1, rows + 1, hauteur)]
+
+    memoire = shared_memory.SharedMemory(create=True, size=max(2 * grille.nbytes, 1))
+    try:
+        np.ndarray(grille.shape, dtype=np.uint8, buffer=memoire.buf)[:] = grille
+        total = 0
+        initargs = (memoire.name, grille.shape)
+        with ProcessPoolExecutor(workers, initializer=_attacher, initargs=initargs) as executor:
+            list(executor.map(compter_bande, *zip(*bandes)))
+
+            # Tour i : {bande: [retraits du halo haut, retraits du halo bas]}
+            entrees = {i: [None, None] for i in range(len(bandes))}
+            premier = True
+            while entrees:
+                indices = sorted(entrees)
+                taches = [
+                    executor.submit(peler_bande, *bandes[i])
+                    if premier
+                    else executor.submit(peler_bande, *bandes[i], *entrees[i])
+                    for i in indices
+                ]
+                entrees = {}
+                for i, tache in zip(indices, taches):
+                    retires, premiere, derniere = tache.result()
+                    total += retires
+                    if i > 0 and premiere.any():
+                        entrees.setdefault(i - 1, [None, None])[1] = premiere
+                    if i + 1 < len(bandes) and derniere.any():
+                        entrees.setdefault(i + 1, [None, None])[0] = derniere
+                premier = False
+    finally:
+        memoire.close()
+        memoire.unlink()
+    return total
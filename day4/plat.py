@@ -0,0 +1,88 @@
+# AOC - Day4 - Grille plate avec bordure (un seul index par case)
+"""
+La grille (rows + 2) x (cols + 2) est stockee ligne par ligne dans un bytearray :
+la case (r, c) de la grille avec bordure est a l'index r * pas + c, avec
+pas = cols + 2. Les 8 voisins sont des decalages fixes (+-1, +-pas, +-pas+-1)
+sur cet index : pas de double indexation grid[r][c] ni de tuple (r, c) a creer.
+"""
+from array import array
+from collections import namedtuple
+
+SEUIL = 4
+TABLE = bytes.maketrans(b"@.", b"\x01\x00")
+
+GrillePlate = namedtuple("GrillePlate", "occupe rows cols pas")
+
+
+def charger_plat(nom_fichier):
+    """Grille plate : occupe[i] = 1 si la case i contient un papier, bordure de 0"""
+    with open(nom_fichier, "rb") as f:
+        lignes = f.read().strip().splitlines()
+
+    rows, cols = len(lignes), len(lignes[0].strip()) if lignes else 0
+    pas = cols + 2
+    occupe = bytearray(pas * (rows + 2))
+    for r, ligne in enumerate(lignes, 1):
+        occupe[r * pas + 1 : r * pas + 1 + cols] = ligne.strip().translate(TABLE)
+    return GrillePlate(occupe, rows, cols, pas)
+
+
+def decalages(pas):
+    """Decalages d'index des 8 voisins, dans l'ordre de grille.DECALAGES"""
+    return (-pas - 1, -pas, -pas + 1, -1, 1, pas - 1, pas, pas + 1)
+
+
+def cases(grille):
+    """Index des cases hors bordure, ligne par ligne"""
+    pas = grille.pas
+    for r in range(1, grille.rows + 1):
+        yield from range(r * pas + 1, r * pas + grille.cols + 1)
+
+
+def position(grille, i):
+    """(ligne, colonne) 0-based dans la grille d'origine de l'index i"""
+    r, c = divmod(i, grille.pas)
+    return r - 1, c - 1
+
+
+def compter_voisins(grille):
+    """array('B') du nombre de voisins papier de chaque papier (0 ailleurs)"""
+    occupe = grille.occupe
+    d0, d1, d2, d3, d4, d5, d6, d7 = decalages(grille.pas)
+    counts = array("B", bytes(len(occupe)))
+    for i in cases(grille):
+        if occupe[i]:
+            counts[i] = (
+                occupe[i + d0] + occupe[i + d1] + occupe[i + d2] + occupe[i + d3]
+                + occupe[i + d4] + occupe[i + d5] + occupe[i + d6] + occupe[i + d7]
+            )
+    return counts
+
+
+def pile_initiale(grille, counts):
+    """array('l') des papiers accessibles, marques comme retires dans occupe"""
+    occupe = grille.occupe
+    pile = array("l")
+    for i in cases(grille):
+        if occupe[i] and counts[i] < SEUIL:
+            pile.append(i)
+            occupe[i] = 0
+    return pile
+
+
+def propager(grille, counts, pile):
+    """Vide la pile en decrementant les voisins ; renvoie le nombre de papiers retires"""
+    occupe = grille.occupe
+    voisins = decalages(grille.pas)
+    total = 0
+    while pile:
+        i = pile.pop()
+        total += 1
+        for d in voisins:
+            j = i + d
+            if occupe[j]:
+                counts[j] -= 1
+                if counts[j] < SEUIL:
+                    pile.append(j)
+                    occupe[j] = 0
+    return total
@@ -0,0 +1,10 @@
+# AOC - Day4 Part 1 - Vectorise (NumPy)
+import sys
+
+from grille import accessibles, charger_grille
+
+nom_fichier = sys.argv[1] if len(sys.argv) > 1 else "data4.txt"
+
+grille = charger_grille(nom_fichier)
+
+print(int(accessibles(grille).sum()))
@@ -0,0 +1,16 @@
+# AOC - Day4 Part 2 - Lignes de bits
+import argparse
+
+from bits import charger_lignes, compter_accessibles, retirer_tout
+
+parser = argparse.ArgumentParser()
+parser.add_argument("nom_fichier", nargs="?", default="data4.txt")
+parser.add_argument("--partie", type=int, choices=(1, 2), default=2)
+args = parser.parse_args()
+
+lignes, cols = charger_lignes(args.nom_fichier)
+
+if args.partie == 1:
+    print(compter_accessibles(lignes, cols))
+else:
+    print(retirer_tout(lignes, cols))
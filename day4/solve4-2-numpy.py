@@ -0,0 +1,23 @@
+# AOC - Day4 Part 2 - Vectorise par vagues (NumPy)
+import argparse
+
+from grille import charger_grille, peler_par_vagues, peler_parallele
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("nom_fichier", nargs="?", default="data4.txt")
+    parser.add_argument("--vagues", action="store_true", help="afficher la taille de chaque vague")
+    parser.add_argument("--workers", type=int, default=1, help="nombre de processus (bandes de lignes)")
+    args = parser.parse_args()
+
+    grille = charger_grille(args.nom_fichier)
+
+    if args.workers > 1:
+        print(peler_parallele(grille, args.workers))
+    else:
+        total, tailles = peler_par_vagues(grille)
+
+        if args.vagues:
+            for numero, taille in enumerate(tailles, 1):
+                print(f"vague {numero} : {taille}")
+        print(total)
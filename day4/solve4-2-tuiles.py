@@ -0,0 +1,18 @@
+# AOC - Day4 Part 2 - Hors memoire par tuiles (memory-map)
+import argparse
+
+from tuiles import compter_accessibles_tuiles, peler_tuiles
+
+parser = argparse.ArgumentParser()
+parser.add_argument("nom_fichier", nargs="?", default="data4.txt")
+parser.add_argument("--partie", type=int, choices=(1, 2), default=2)
+parser.add_argument("--budget-mo", type=int, default=64, help="RAM de travail par tuile (Mo)")
+parser.add_argument("--dossier", help="dossier du fichier d'etat temporaire")
+args = parser.parse_args()
+
+budget = args.budget_mo << 20
+
+if args.partie == 1:
+    print(compter_accessibles_tuiles(args.nom_fichier, budget))
+else:
+    print(peler_tuiles(args.nom_fichier, budget, args.dossier))
@@ -0,0 +1,151 @@
+# AOC - Day4 - Traitement par tuiles d'une grille en memory-map (hors memoire)
+"""
+Le fichier '@'/'.' brut est mappe en memoire (pas de ligne fixe = cols + fin de ligne).
+L'etat courant de la grille vit dans un fichier temporaire uint8 mappe lui aussi,
+avec une bordure de 0. Chaque tuile est copiee en RAM avec un halo d'une case,
+pelee jusqu'a stabilite locale (le halo reste fige), puis recopiee. Quand un
+retrait touche le bord d'une tuile, les tuiles voisines concernees repartent
+dans la file de travail : a la fin, plus aucune tuile ne bouge et la grille
+entiere est stable. L'ordre des retraits ne change pas le resultat (un papier
+accessible le reste quand ses voisins disparaissent).
+"""
+import math
+import os
+import tempfile
+from collections import deque
+
+import numpy as np
+
+from grille import accessibles, peler_sur_place
+
+BUDGET = 64 << 20  # octets de RAM pour une tuile et ses tableaux de travail
+OCTETS_PAR_CASE = 8  # tuile, compteurs, masques et temporaires NumPy
+
+
+def ouvrir_brut(nom_fichier):
+    """Memory-map du fichier brut : (brut, rows, cols, pas d'une ligne en octets)"""
+    brut = np.memmap(nom_fichier, dtype=np.uint8, mode="r")
+    fins = np.flatnonzero(brut[: 1 << 20] == ord("\n"))
+    if not len(fins) and len(brut) <= 1 << 20:
+        # Une seule ligne, sans fin de ligne
+        return brut, 1, len(brut), len(brut) + 1
+    if not len(fins):
+        raise ValueError(f"{nom_fichier} : premiere ligne introuvable (ligne > 1 Mo ?)")
+    fin_ligne = 2 if fins[0] > 0 and brut[fins[0] - 1] == ord("\r") else 1
+    cols = int(fins[0]) + 1 - fin_ligne
+    pas = cols + fin_ligne
+    rows = (len(brut) + fin_ligne) // pas
+    return brut, rows, cols, pas
+
+
+def lire_cases(brut, r0, r1, c0, c1, pas):
+    """Cases [r0, r1) x [c0, c1) du fichier brut en tableau uint8 de 0/1.
+
+    Seules ces colonnes sont lues dans le memory-map : la memoire suit la
+    taille du bloc demande, pas la largeur de la grille.
+    """
+    octets = brut[r0 * pas : r1 * pas]
+    completes = min(r1 - r0, len(octets) // pas)
+    cases = np.zeros((r1 - r0, c1 - c0), dtype=np.uint8)
+    cases[:completes] = octets[: completes * pas].reshape(completes, pas)[:, c0:c1] == ord("@")
+    if completes < r1 - r0:
+        # Derniere ligne sans fin de ligne
+        cases[completes] = octets[completes * pas :][c0:c1] == ord("@")
+    return cases
+
+
+def lire_bloc(brut, rows, cols, pas, r0, r1, c0, c1):
+    """Bloc [r0, r1) x [c0, c1) avec un halo d'une case (0 hors de la grille)"""
+    bloc = np.zeros((r1 - r0 + 2, c1 - c0 + 2), dtype=np.uint8)
+    h0, h1, g0, g1 = max(r0 - 1, 0), min(r1 + 1, rows), max(c0 - 1, 0), min(c1 + 1, cols)
+    bloc[1 + h0 - r0 : 1 + h1 - r0, 1 + g0 - c0 : 1 + g1 - c0] = lire_cases(brut, h0, h1, g0, g1, pas)
+    return bloc
+
+
+def creer_etat(brut, rows, cols, pas, budget=BUDGET, dossier=None):
+    """Fichier temporaire (rows + 2, cols + 2) uint8 avec bordure de 0, rempli tuile par tuile"""
+    fichier = tempfile.NamedTemporaryFile(dir=dossier, suffix=".grille", delete=False)
+    fichier.close()
+    etat = np.memmap(fichier.name, dtype=np.uint8, mode="w+", shape=(rows + 2, cols + 2))
+    hauteur, largeur = taille_tuiles(rows, cols, budget)
+    for ti, tj in _tuiles(rows, cols, hauteur, largeur):
+        r0, r1, c0, c1 = _bornes(ti, tj, rows, cols, hauteur, largeur)
+        etat[r0:r1, c0:c1] = lire_cases(brut, r0 - 1, r1 - 1, c0 - 1, c1 - 1, pas)
+    etat.flush()
+    return etat
+
+
+def taille_tuiles(rows, cols, budget):
+    """(hauteur, largeur) d'une tuile dont le bloc avec halo tient dans le budget"""
+    cases = max(budget // OCTETS_PAR_CASE, 9)
+    largeur = min(cols, max(1, math.isqrt(cases) - 2))
+    hauteur = min(rows, max(1, cases // (largeur + 2) - 2))
+    return hauteur, largeur
+
+
+def _bords_touches(retraits):
+    """Directions (dr, dc) des tuiles voisines dont le halo contient un retrait"""
+    directions = []
+    for dr, lignes in ((-1, retraits[0]), (0, retraits), (1, retraits[-1])):
+        for dc, colonnes in ((-1, np.s_[..., 0]), (0, np.s_[...]), (1, np.s_[..., -1])):
+            if (dr, dc) != (0, 0) and lignes[colonnes].any():
+                directions.append((dr, dc))
+    return directions
+
+
+def _tuiles(rows, cols, hauteur, largeur):
+    return [(ti, tj) for ti in range(math.ceil(rows / hauteur)) for tj in range(math.ceil(cols / largeur))]
+
+
+def _bornes(ti, tj, rows, cols, hauteur, largeur):
+    """Bornes de la tuile dans le fichier d'etat (decale de 1 par la bordure)"""
+    r0, c0 = 1 + ti * hauteur, 1 + tj * largeur
+    return r0, min(r0 + hauteur, rows + 1), c0, min(c0 + largeur, cols + 1)
+
+
+def compter_accessibles_tuiles(nom_fichier, budget=BUDGET):
+    """Partie 1 tuile par tuile, directement depuis le fichier brut"""
+    brut, rows, cols, pas = ouvrir_brut(nom_fichier)
+    hauteur, largeur = taille_tuiles(rows, cols, budget)
+    total = 0
+    for ti, tj in _tuiles(rows, cols, hauteur, largeur):
+        r0, r1, c0, c1 = _bornes(ti, tj, rows, cols, hauteur, largeur)
+        bloc = lire_bloc(brut, rows, cols, pas, r0 - 1, r1 - 1, c0 - 1, c1 - 1)
+        total += int(accessibles(bloc).sum())
+    return total
+
+
+def peler_tuiles(nom_fichier, budget=BUDGET, dossier=None):
+    """Partie 2 hors memoire : renvoie le nombre total de papiers retires"""
+    brut, rows, cols, pas = ouvrir_brut(nom_fichier)
+    etat = creer_etat(brut, rows, cols, pas, budget, dossier)
+    hauteur, largeur = taille_tuiles(rows, cols, budget)
+    nb_ti, nb_tj = math.ceil(rows / hauteur), math.ceil(cols / largeur)
+
+    file = deque(_tuiles(rows, cols, hauteur, largeur))
+    en_attente = set(file)
+    total = 0
+    try:
+        while file:
+            tuile = file.popleft()
+            en_attente.discard(tuile)
+            r0, r1, c0, c1 = _bornes(*tuile, rows, cols, hauteur, largeur)
+
+            bloc = np.array(etat[r0 - 1 : r1 + 1, c0 - 1 : c1 + 1])
+            avant = bloc[1:-1, 1:-1].copy()
+            retires = sum(peler_sur_place(bloc))
+            if not retires:
+                continue
+
+            total += retires
+            etat[r0:r1, c0:c1] = bloc[1:-1, 1:-1]
+            for dr, dc in _bords_touches(avant != bloc[1:-1, 1:-1]):
+                voisine = (tuile[0] + dr, tuile[1] + dc)
+                if 0 <= voisine[0] < nb_ti and 0 <= voisine[1] < nb_tj and voisine not in en_attente:
+                    file.append(voisine)
+                    en_attente.add(voisine)
+    finally:
+        nom_etat = etat.filename
+        del etat
+        os.remove(nom_etat)
+    return total